@@ -1,6 +1,6 @@
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.repositories.base_repository import async_session_maker
 
@@ -8,3 +8,8 @@ from app.repositories.base_repository import async_session_maker
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         yield session
+
+
+def get_db_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Session factory for responses that outlive the request scoped session."""
+    return async_session_maker
@@ -1,14 +1,15 @@
-from datetime import timedelta
-
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_db_session
-from app.core.security import ACCESS_TOKEN_EXPIRE_MINUTES
-from app.schemas.security_schema import Token, TokenType
+from app.schemas.security_schema import RefreshTokenRequest, Token
 from app.schemas.user_schema import UserCreate, UserResponse
-from app.services.security_service import authenticate_user, create_access_token
+from app.services.security_service import (
+    authenticate_user,
+    issue_tokens,
+    refresh_tokens,
+)
 from app.services.user_service import UserService
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -29,12 +30,15 @@ async def login_for_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
-    )
+    return await issue_tokens(session, user)
+
 
-    return Token(access_token=access_token, token_type=TokenType.BEARER)
+@router.post("/refresh", response_model=Token)
+async def refresh_access_token(
+    request: RefreshTokenRequest,
+    session: AsyncSession = Depends(get_db_session),
+) -> Token:
+    return await refresh_tokens(session, request.refresh_token)
 
 
 @router.post("/register", response_model=UserResponse, status_code=201)
@@ -3,6 +3,9 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_db_session
+from app.core.cache import cache_backend
+from app.core.security import password_hasher
+from app.repositories.part_repository import part_count_cache
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -23,3 +26,15 @@ async def db_health(session: AsyncSession = db_dependency) -> dict:
         return {"status": "database connected"}
     except Exception as e:
         return {"status": "database error", "detail": str(e)}
+
+
+@router.get("/cache")
+async def cache_stats() -> dict:
+    """Size and hit/miss/eviction counters of the caches of this worker."""
+    return {"cache": cache_backend.stats(), "part_count": part_count_cache.stats()}
+
+
+@router.get("/password-hasher")
+async def password_hasher_stats() -> dict:
+    """Load of the bcrypt thread pool and how long calls waited for a thread."""
+    return password_hasher.stats()
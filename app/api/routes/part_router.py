@@ -1,25 +1,51 @@
+import uuid
 from datetime import datetime
 from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, Query, Response, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    File,
+    Header,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.api.dependencies import get_db_session
+from app.api.dependencies import get_db_session, get_db_session_factory
 from app.models.part import CollaboratorPermission, PartVisibility
 from app.models.user import User
 from app.schemas.part_schema import (
+    PartBulkCreateResponse,
+    PartBulkDelete,
+    PartBulkResult,
+    PartBulkUpdate,
+    PartCollaboratorBulkGrant,
+    PartCollaboratorBulkResult,
+    PartCollaboratorBulkRevoke,
     PartCollaboratorResponse,
     PartCreate,
+    PartExportFormat,
+    PartImportResponse,
     PartListQueryParams,
     PartPaginatedResponse,
     PartResponse,
     PartSortBy,
     PartUpdate,
     SortOrder,
+    TopWordsQueryParams,
     TopWordsResponse,
+    TotalMode,
 )
 from app.services.part_service import PartService
 from app.services.security_service import get_current_active_user
+from app.utils.etag import etag_matches, list_etag, part_etag
 
 router = APIRouter(prefix="/parts", tags=["parts"])
 
@@ -35,10 +61,7 @@ async def create_part(
     return await part_service.create_part(session, part, current_user)
 
 
-@router.get("", response_model=PartPaginatedResponse)
-async def list_parts(
-    session: AsyncSession = Depends(get_db_session),
-    current_user: Optional[User] = Depends(get_current_active_user),
+def get_part_filter_params(
     visibility: Optional[str] = Query(None),
     is_active: Optional[bool] = Query(None),
     name: Optional[List[str]] = Query(None),
@@ -46,13 +69,11 @@ async def list_parts(
     end_date: Optional[datetime] = Query(None),
     sort_by: Optional[str] = Query("created_at"),
     sort_order: Optional[str] = Query("desc"),
-    limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0),
-) -> Any:
+) -> PartListQueryParams:
     visibility_enum = PartVisibility(visibility.upper()) if visibility else None
     sort_by_enum = PartSortBy(sort_by) if sort_by else PartSortBy.created_at
     sort_order_enum = SortOrder(sort_order) if sort_order else SortOrder.desc
-    params = PartListQueryParams(
+    return PartListQueryParams(
         visibility=visibility_enum,
         is_active=is_active,
         name=name,
@@ -60,28 +81,197 @@ async def list_parts(
         end_date=end_date,
         sort_by=sort_by_enum,
         sort_order=sort_order_enum,
-        limit=limit,
-        offset=offset,
     )
+
+
+@router.post(
+    "/bulk",
+    response_model=PartBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_parts_bulk(
+    parts: List[PartCreate] = Body(..., min_length=1, max_length=1000),
+    partial: bool = Query(False),
+    session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+) -> PartBulkCreateResponse:
+    return await part_service.create_parts_bulk(
+        session, parts, current_user, partial=partial
+    )
+
+
+@router.post("/import", response_model=PartImportResponse)
+async def import_parts(
+    file: UploadFile = File(..., description="CSV file with a header row"),
+    session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+) -> PartImportResponse:
+    return await part_service.import_parts_csv(session, file, current_user)
+
+
+@router.patch("/bulk", response_model=PartBulkResult)
+async def update_parts_bulk(
+    bulk_update: PartBulkUpdate,
+    session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+) -> PartBulkResult:
+    return await part_service.update_parts_bulk(session, bulk_update, current_user)
+
+
+@router.delete("/bulk", response_model=PartBulkResult)
+async def delete_parts_bulk(
+    bulk_delete: PartBulkDelete,
+    session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+) -> PartBulkResult:
+    return await part_service.delete_parts_bulk(session, bulk_delete, current_user)
+
+
+@router.post(
+    "/collaborators/bulk",
+    response_model=PartCollaboratorBulkResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def add_collaborators_bulk(
+    grant: PartCollaboratorBulkGrant,
+    session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+) -> PartCollaboratorBulkResult:
+    return await part_service.add_collaborators_bulk(session, grant, current_user)
+
+
+@router.delete("/collaborators/bulk", response_model=PartCollaboratorBulkResult)
+async def remove_collaborators_bulk(
+    revoke: PartCollaboratorBulkRevoke,
+    session: AsyncSession = Depends(get_db_session),
+    current_user: User = Depends(get_current_active_user),
+) -> PartCollaboratorBulkResult:
+    return await part_service.remove_collaborators_bulk(session, revoke, current_user)
+
+
+@router.get("", response_model=PartPaginatedResponse)
+async def list_parts(
+    response: Response,
+    session: AsyncSession = Depends(get_db_session),
+    current_user: Optional[User] = Depends(get_current_active_user),
+    filter_params: PartListQueryParams = Depends(get_part_filter_params),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
+    total: TotalMode = Query(TotalMode.exact),
+    if_none_match: Optional[str] = Header(None),
+) -> Any:
+    params = filter_params.model_copy(
+        update={
+            "limit": limit,
+            "offset": offset,
+            "cursor": cursor,
+            "total_mode": total,
+        }
+    )
+    # The page is read once and the ETag built from it, so a stale If-None-Match
+    # costs no more than a plain GET
     result = await part_service.list_parts(session, current_user, params)
+    etag = list_etag(
+        [(item.id, item.updated_at) for item in result.items],
+        result.next_cursor is not None,
+        result.total,
+    )
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    response.headers["ETag"] = etag
     return result
 
 
+@router.get("/export")
+async def export_parts(
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_db_session_factory),
+    current_user: Optional[User] = Depends(get_current_active_user),
+    params: PartListQueryParams = Depends(get_part_filter_params),
+    export_format: PartExportFormat = Query(PartExportFormat.ndjson, alias="format"),
+) -> StreamingResponse:
+    rows = part_service.export_parts(
+        session_factory, current_user, params, export_format
+    )
+    if export_format == PartExportFormat.csv:
+        media_type = "text/csv"
+    else:
+        media_type = "application/x-ndjson"
+
+    return StreamingResponse(
+        rows,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename=parts.{export_format.value}"
+        },
+    )
+
+
 @router.get("/top-words", response_model=TopWordsResponse)
 async def get_top_words(
+    n: int = Query(5, ge=1, le=100),
+    visibility: Optional[str] = Query(None),
+    owner_id: Optional[uuid.UUID] = Query(None),
+    is_active: Optional[bool] = Query(None),
+    name: Optional[List[str]] = Query(None),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
     session: AsyncSession = Depends(get_db_session),
     current_user: User = Depends(get_current_active_user),
 ) -> TopWordsResponse:
-    return await part_service.get_top_words_in_descriptions(session)
+    try:
+        # Validated by the schema, which also accepts lowercase visibility
+        params = TopWordsQueryParams.model_validate(
+            {
+                "n": n,
+                "visibility": visibility,
+                "owner_id": owner_id,
+                "is_active": is_active,
+                "name": name,
+                "start_date": start_date,
+                "end_date": end_date,
+            }
+        )
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors())
+    return await part_service.get_top_words_in_descriptions(
+        session, current_user, params
+    )
+
+
+@router.get("/search", response_model=PartPaginatedResponse)
+async def search_parts(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    session: AsyncSession = Depends(get_db_session),
+    current_user: Optional[User] = Depends(get_current_active_user),
+) -> PartPaginatedResponse:
+    return await part_service.search_parts(session, current_user, q, limit, offset)
 
 
 @router.get("/{part_id}", response_model=PartResponse)
 async def get_part(
     part_id: str,
+    response: Response,
     session: AsyncSession = Depends(get_db_session),
     current_user: Optional[User] = Depends(get_current_active_user),
-) -> PartResponse:
-    return await part_service.get_part(session, part_id, current_user)
+    if_none_match: Optional[str] = Header(None),
+) -> Any:
+    # Revalidation only reads updated_at, the part is never serialized on a match
+    if if_none_match:
+        etag = await part_service.get_part_etag(session, part_id, current_user)
+        if etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+    part = await part_service.get_part(session, part_id, current_user)
+    response.headers["ETag"] = part_etag(part.id, part.updated_at)
+    return part
 
 
 @router.patch("/{part_id}", response_model=PartResponse)
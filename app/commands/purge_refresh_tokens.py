@@ -0,0 +1,22 @@
+"""
+Delete expired refresh tokens.
+
+Refreshing already drops the expired tokens of the user refreshing, run this
+periodically (e.g. daily from cron) for users who stopped refreshing:
+
+    python -m app.commands.purge_refresh_tokens
+"""
+
+import asyncio
+
+from app.repositories.base_repository import async_session_maker
+from app.services.security_service import purge_expired_refresh_tokens
+
+
+async def main() -> None:
+    async with async_session_maker() as session:
+        await purge_expired_refresh_tokens(session)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
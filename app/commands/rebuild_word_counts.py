@@ -0,0 +1,22 @@
+"""
+Recompute the part_word_count table from every part description.
+
+The index is kept up to date by the part writes themselves, run this to
+backfill it or to repair it after writes that bypassed the repositories:
+
+    python -m app.commands.rebuild_word_counts
+"""
+
+import asyncio
+
+from app.repositories.base_repository import async_session_maker
+from app.services.part_service import PartService
+
+
+async def main() -> None:
+    async with async_session_maker() as session:
+        await PartService().rebuild_word_counts(session)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
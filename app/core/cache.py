@@ -0,0 +1,292 @@
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Hashable, Optional
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import CacheBackendType, settings
+from app.core.redis import create_redis_client
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache where every entry expires after `ttl` seconds.
+    A max_size of 0 disables it. Hits, misses and evictions are counted.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Stores value for `ttl` seconds, the cache ttl when not given."""
+        if not self.enabled:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        for key in [key for key in self._entries if str(key).startswith(prefix)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CacheBackend(ABC):
+    """
+    Async key/value cache shared by the services. Values must be JSON
+    compatible so every backend stores and returns them the same way.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float) -> None: ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Drops keys everywhere, including the local copies of other workers."""
+
+    @abstractmethod
+    async def delete_prefix(self, prefix: str) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict: ...
+
+    async def start(self) -> None:
+        """Called once on application startup."""
+
+    async def close(self) -> None:
+        """Called once on application shutdown."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Per-process backend, only coherent when running a single worker."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.local = TTLCache(max_size=max_size, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self.local.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self.local.set(key, value, ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.local.delete(key)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        self.local.delete_prefix(prefix)
+
+    def stats(self) -> dict:
+        return {"backend": CacheBackendType.memory.value, **self.local.stats()}
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis shared by all workers, fronted by a small local cache per worker.
+    Deletes are published on a channel so every worker drops its local copy.
+    Redis being unreachable degrades to cache misses, never to errors.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        local: TTLCache,
+        channel: str,
+        key_prefix: str = "",
+    ) -> None:
+        self.client = client
+        self.local = local
+        self.channel = channel
+        self.key_prefix = key_prefix
+        self.errors = 0
+        self.subscribed = asyncio.Event()
+        self._subscriber: Optional[asyncio.Task] = None
+
+    async def _run(self, command: str, call: Awaitable[Any]) -> Any:
+        try:
+            return await call
+        except RedisError as exc:
+            self.errors += 1
+            logger.warning(f"Cache command {command} failed: {exc}")
+            return None
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = self.local.get(key)
+        if value is not None:
+            return value
+        raw = await self._run("GET", self.client.get(self.key_prefix + key))
+        if raw is None:
+            return None
+        value = json.loads(raw)
+        self.local.set(key, value)
+
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        # Local copies stay short lived, they only miss a dropped invalidation
+        # for that long
+        self.local.set(key, value, min(ttl, self.local.ttl))
+        await self._run(
+            "SET",
+            self.client.set(
+                self.key_prefix + key, json.dumps(value), px=int(ttl * 1000)
+            ),
+        )
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        for key in keys:
+            self.local.delete(key)
+        await self._run(
+            "DEL", self.client.delete(*(self.key_prefix + key for key in keys))
+        )
+        await self._run(
+            "PUBLISH", self.client.publish(self.channel, json.dumps({"keys": keys}))
+        )
+
+    async def delete_prefix(self, prefix: str) -> None:
+        self.local.delete_prefix(prefix)
+        cursor = 0
+        while True:
+            reply = await self._run(
+                "SCAN",
+                self.client.scan(
+                    cursor, match=f"{self.key_prefix}{prefix}*", count=1000
+                ),
+            )
+            if reply is None:
+                break
+            cursor, keys = reply
+            if keys:
+                await self._run("UNLINK", self.client.unlink(*keys))
+            if cursor == 0:
+                break
+        await self._run(
+            "PUBLISH",
+            self.client.publish(self.channel, json.dumps({"prefix": prefix})),
+        )
+
+    def _apply_invalidation(self, payload: bytes) -> None:
+        message = json.loads(payload)
+        for key in message.get("keys", []):
+            self.local.delete(key)
+        if "prefix" in message:
+            self.local.delete_prefix(message["prefix"])
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        if message["type"] == "subscribe":
+                            self.subscribed.set()
+                        elif message["type"] == "message":
+                            self._apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(f"Cache invalidation subscriber failed: {exc}")
+            # Invalidations may have been missed while disconnected
+            self.subscribed.clear()
+            self.local.clear()
+            await asyncio.sleep(1)
+
+    async def start(self) -> None:
+        self._subscriber = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._subscriber is not None:
+            self._subscriber.cancel()
+            try:
+                await self._subscriber
+            except asyncio.CancelledError:
+                pass
+            self._subscriber = None
+        await self.client.aclose()
+
+    def stats(self) -> dict:
+        return {
+            "backend": CacheBackendType.redis.value,
+            "subscribed": self.subscribed.is_set(),
+            "errors": self.errors,
+            **self.local.stats(),
+        }
+
+
+def create_cache_backend() -> CacheBackend:
+    if settings.CACHE_BACKEND == CacheBackendType.redis:
+        return RedisCacheBackend(
+            client=create_redis_client(
+                settings.REDIS_URL,
+                pool_size=settings.REDIS_POOL_SIZE,
+                timeout=settings.REDIS_TIMEOUT_SECONDS,
+            ),
+            local=TTLCache(
+                max_size=settings.CACHE_MAX_SIZE, ttl=settings.CACHE_LOCAL_TTL_SECONDS
+            ),
+            channel=settings.CACHE_INVALIDATION_CHANNEL,
+            key_prefix=settings.CACHE_KEY_PREFIX,
+        )
+
+    return InMemoryCacheBackend(
+        max_size=settings.CACHE_MAX_SIZE, ttl=settings.CACHE_LOCAL_TTL_SECONDS
+    )
+
+
+cache_backend = create_cache_backend()
@@ -11,6 +11,11 @@ class Environment(str, Enum):
     PRODUCTION = "production"
 
 
+class CacheBackendType(str, Enum):
+    memory = "memory"
+    redis = "redis"
+
+
 class Settings(BaseSettings):
     # Service info
     ENVIRONMENT: Environment = Environment.LOCAL
@@ -27,6 +32,39 @@ class Settings(BaseSettings):
     SECRET_KEY: str = ""
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # bcrypt runs on this many threads, beyond the queue limit requests get 503
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
+    # Cache settings. CACHE_MAX_SIZE bounds the per worker cache, 0 disables it
+    CACHE_BACKEND: CacheBackendType = CacheBackendType.memory
+    CACHE_MAX_SIZE: int = 1024
+    CACHE_LOCAL_TTL_SECONDS: int = 60
+    CACHE_KEY_PREFIX: str = "parts-api:"
+    CACHE_INVALIDATION_CHANNEL: str = "parts-api:cache-invalidation"
+    REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_POOL_SIZE: int = 10
+    REDIS_TIMEOUT_SECONDS: float = 0.5
+    PART_CACHE_TTL_SECONDS: int = 60
+    PERMISSION_CACHE_TTL_SECONDS: int = 300
+    USER_CACHE_TTL_SECONDS: int = 60
+    TOP_WORDS_CACHE_TTL_SECONDS: int = 60
+
+    # Pagination settings
+    PART_COUNT_CACHE_TTL_SECONDS: int = 30
+    PART_COUNT_CACHE_MAX_SIZE: int = 1024
+    PART_EXPORT_CHUNK_SIZE: int = 1000
+
+    # Import settings
+    PART_IMPORT_CHUNK_SIZE_BYTES: int = 1024 * 1024
+    # Rows fetched per round trip while merging staged rows into part
+    PART_IMPORT_MERGE_BATCH_SIZE: int = 1000
+    PART_IMPORT_MAX_REPORTED_REJECTIONS: int = 1000
+
+    # Word count settings
+    WORD_COUNT_REBUILD_CHUNK_SIZE: int = 5000
+    WORD_COUNT_REBUILD_WORKERS: Optional[int] = None
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,24 @@
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+
+def create_redis_client(url: str, pool_size: int = 10, timeout: float = 1.0) -> Redis:
+    """
+    Pooled client for a redis:// or rediss:// (TLS) URL. Commands wait up to
+    `timeout` for a free connection and again for the reply. A failed command
+    is retried once at once, so a stale pooled connection doesn't surface as
+    an error but an unreachable server fails fast.
+    """
+    pool = BlockingConnectionPool.from_url(
+        url,
+        max_connections=pool_size,
+        timeout=timeout,
+        socket_timeout=timeout,
+        socket_connect_timeout=timeout,
+        retry=Retry(NoBackoff(), 1),
+        # RESP2 also works with servers older than Redis 6, which lack HELLO
+        protocol=2,
+    )
+
+    return Redis.from_pool(pool)
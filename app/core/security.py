@@ -1,3 +1,8 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
 from fastapi.security import OAuth2PasswordBearer
 from passlib.context import CryptContext
 
@@ -9,3 +14,85 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 SECRET_KEY = getattr(settings, "SECRET_KEY", "")
 ALGORITHM = getattr(settings, "ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = getattr(settings, "ACCESS_TOKEN_EXPIRE_MINUTES", 30)
+
+
+class PasswordHasherBusy(Exception):
+    """Every hashing thread is busy and the queue is full."""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated thread pool so it never blocks the event loop.
+    bcrypt releases the GIL, so the threads hash in parallel. At most
+    `workers` hashes run and `max_queue` wait, further calls are rejected.
+    Also tracks how long calls wait for a thread.
+    """
+
+    def __init__(self, context: CryptContext, workers: int, max_queue: int) -> None:
+        self.context = context
+        self.workers = workers
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusy(f"{self.in_flight} password hashes in flight")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hasher"
+            )
+
+        submitted_at = time.perf_counter()
+
+        def timed() -> tuple[float, Any]:
+            return time.perf_counter() - submitted_at, func(*args)
+
+        self.in_flight += 1
+        try:
+            waited, result = await asyncio.get_running_loop().run_in_executor(
+                self._executor, timed
+            )
+        finally:
+            self.in_flight -= 1
+
+        self.completed += 1
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(self.context.verify, password, hashed_password)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_seconds_avg": self.wait_seconds_total / self.completed
+            if self.completed
+            else 0.0,
+            "wait_seconds_max": self.wait_seconds_max,
+        }
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    pwd_context,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
@@ -1,12 +1,25 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from app.api.routes.auth_router import router as auth_router
 from app.api.routes.health_router import router as health_router
 from app.api.routes.part_router import router as part_router
 from app.api.routes.user_router import router as user_router
+from app.core.cache import cache_backend
 from app.core.logging import setup_logging
+from app.core.security import password_hasher
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    await cache_backend.start()
+    yield
+    await cache_backend.close()
+    password_hasher.close()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 setup_logging()
 
@@ -1,5 +1,14 @@
 from .base import Base
 from .part import Part, PartCollaborator
+from .part_word_count import PartWordCount
+from .refresh_token import RefreshToken
 from .user import User
 
-__all__ = ["Base", "Part", "User", "PartCollaborator"]
+__all__ = [
+    "Base",
+    "Part",
+    "User",
+    "PartCollaborator",
+    "PartWordCount",
+    "RefreshToken",
+]
@@ -1,6 +1,17 @@
 from enum import StrEnum
 
-from sqlalchemy import Boolean, Enum, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -18,7 +29,7 @@ class CollaboratorPermission(StrEnum):
 
 class Part(Base):
     __tablename__ = "part"
-    name: Mapped[str] = mapped_column(String(150), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(150), nullable=False)
     sku: Mapped[str] = mapped_column(String(30), nullable=False, unique=True)
     description: Mapped[str] = mapped_column(String(1024))
     weight_ounces: Mapped[int] = mapped_column(Integer)
@@ -27,20 +38,113 @@ class Part(Base):
         Enum(PartVisibility, native_enum=False),
         default=PartVisibility.PUBLIC,
         nullable=False,
-        index=True,
     )
     owner_id: Mapped[str] = mapped_column(
-        ForeignKey("user.id", name="fk_part_owner_id"), nullable=False, index=True
+        ForeignKey("user.id", name="fk_part_owner_id"), nullable=False
+    )
+    # Generated by Postgres for full-text search, never loaded with the part
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
     )
 
+    __table_args__ = (
+        Index(
+            "ix_part_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("ix_part_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+
+# Listing indexes: equality filters first, then the sort column and id as tie
+# breaker, so a page is read in order off the index instead of sorted. They
+# also cover the owner_id, visibility and name lookups the single column ones
+# did. Sorting by visibility or is_active isn't indexed, with two values each
+# those orders are mostly by id and aren't worth an index per scope.
+_PUBLIC = text("visibility = 'PUBLIC'")
+_PUBLIC_ACTIVE = text("visibility = 'PUBLIC' AND is_active")
+Index("ix_part_created_at_id", Part.created_at.desc(), Part.id.desc())
+Index("ix_part_updated_at_id", Part.updated_at.desc(), Part.id.desc())
+Index(
+    "ix_part_owner_id_created_at",
+    Part.owner_id,
+    Part.created_at.desc(),
+    Part.id.desc(),
+)
+Index(
+    "ix_part_owner_id_updated_at",
+    Part.owner_id,
+    Part.updated_at.desc(),
+    Part.id.desc(),
+)
+Index(
+    "ix_part_visibility_is_active_created_at",
+    Part.visibility,
+    Part.is_active,
+    Part.created_at.desc(),
+    Part.id.desc(),
+)
+Index(
+    "ix_part_visibility_is_active_updated_at",
+    Part.visibility,
+    Part.is_active,
+    Part.updated_at.desc(),
+    Part.id.desc(),
+)
+Index("ix_part_name_id", Part.name, Part.id)
+Index("ix_part_owner_id_name", Part.owner_id, Part.name, Part.id)
+Index(
+    "ix_part_visibility_is_active_name",
+    Part.visibility,
+    Part.is_active,
+    Part.name,
+    Part.id,
+)
+Index(
+    "ix_part_public_created_at",
+    Part.created_at.desc(),
+    Part.id.desc(),
+    postgresql_where=_PUBLIC,
+)
+Index(
+    "ix_part_public_updated_at",
+    Part.updated_at.desc(),
+    Part.id.desc(),
+    postgresql_where=_PUBLIC,
+)
+Index("ix_part_public_name", Part.name, Part.id, postgresql_where=_PUBLIC)
+Index(
+    "ix_part_public_active_created_at",
+    Part.created_at.desc(),
+    Part.id.desc(),
+    postgresql_where=_PUBLIC_ACTIVE,
+)
+
 
 class PartCollaborator(Base):
     __tablename__ = "part_collaborator"
+    # A user is a collaborator of a part at most once, the unique index also
+    # serves lookups by part_id
+    __table_args__ = (
+        UniqueConstraint(
+            "part_id", "user_id", name="uq_part_collaborator_part_id_user_id"
+        ),
+    )
     part_id: Mapped[str] = mapped_column(
         ForeignKey("part.id", name="fk_partcollaborator_part_id"), nullable=False
     )
     user_id: Mapped[str] = mapped_column(
-        ForeignKey("user.id", name="fk_partcollaborator_user_id"), nullable=False
+        ForeignKey("user.id", name="fk_partcollaborator_user_id"),
+        nullable=False,
+        index=True,
     )
     permission: Mapped[CollaboratorPermission] = mapped_column(
         Enum(CollaboratorPermission, native_enum=False),
@@ -0,0 +1,20 @@
+from sqlalchemy import Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class PartWordCount(Base):
+    """How many times each word appears across all part descriptions."""
+
+    __tablename__ = "part_word_count"
+    word: Mapped[str] = mapped_column(String(1024), nullable=False, unique=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+# Serves the top-N read, ORDER BY count DESC, word LIMIT n
+Index(
+    "ix_part_word_count_count_word",
+    PartWordCount.count.desc(),
+    PartWordCount.word,
+)
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class RefreshToken(Base):
+    """
+    Refresh token of a user. Only the SHA-256 of the token is stored, a token
+    is used once and replaced by a new one on every refresh.
+    """
+
+    __tablename__ = "refresh_token"
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    user_id: Mapped[str] = mapped_column(
+        ForeignKey("user.id", name="fk_refreshtoken_user_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    revoked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -1,6 +1,6 @@
 from enum import StrEnum
 
-from sqlalchemy import Boolean, Enum, String
+from sqlalchemy import Boolean, Enum, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -23,3 +23,8 @@ class User(Base):
         nullable=False,
         index=True,
     )
+
+
+# Case-insensitive login by username or email, see UserRepository.get_by_identifier
+Index("ix_user_lower_username", func.lower(User.username))
+Index("ix_user_lower_email", func.lower(User.email))
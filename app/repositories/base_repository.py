@@ -1,7 +1,10 @@
+import json
 from typing import Any, Generic, Optional, Type, TypeVar
 
-from sqlalchemy import or_, select
+from sqlalchemy import delete, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 from app.core.config import settings
 
@@ -11,6 +14,20 @@ engine = create_async_engine(settings.database_url, echo=False, future=True)
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
 
+class Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
 class BaseRepository(Generic[T]):
     """Generic base repository for CRUD operations."""
 
@@ -30,57 +47,82 @@ class BaseRepository(Generic[T]):
         result = await session.execute(select(self.model).offset(skip).limit(limit))
         return result.scalars().all()
 
+    async def estimate_count(self, session: AsyncSession, query: Any) -> int:
+        """Row count estimated by the query planner, no rows are actually read."""
+        result = await session.execute(Explain(query))
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     async def create(self, session: AsyncSession, obj_in: Any) -> T:
-        """Create a new object from a Pydantic schema or dict."""
+        """
+        Create a new object from a Pydantic schema or dict with a single
+        INSERT ... RETURNING, server defaults come back without a refresh.
+        """
         if isinstance(obj_in, dict):
             data = obj_in
         else:
             data = obj_in.model_dump()
-        db_obj = self.model(**data)
-        session.add(db_obj)
+        result = await session.execute(
+            insert(self.model).values(**data).returning(self.model)
+        )
+        db_obj = result.scalar_one()
         await session.commit()
-        await session.refresh(db_obj)
         return db_obj
 
     async def update(
         self, session: AsyncSession, obj_id: Any, obj_in: Any
     ) -> Optional[T]:
-        """Update an existing object by its primary key."""
-        result = await session.execute(
-            select(self.model).where(self.model.id == obj_id)  # type: ignore
-        )
-        db_obj = result.scalars().first()
-        if not db_obj:
-            return None
+        """
+        Update an existing object by its primary key with a single
+        UPDATE ... RETURNING, an instance already in the session is refreshed.
+        """
         if isinstance(obj_in, dict):
             data = obj_in
         else:
             data = obj_in.model_dump(exclude_unset=True)
-        for field, value in data.items():
-            setattr(db_obj, field, value)
+        if not data:
+            return await self.get(session, obj_id)
+        result = await session.execute(
+            update(self.model)
+            .where(self.model.id == obj_id)  # type: ignore
+            .values(**data)
+            .returning(self.model)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        db_obj = result.scalars().first()
         await session.commit()
-        await session.refresh(db_obj)
         return db_obj
 
     async def delete(self, session: AsyncSession, obj_id: Any) -> bool:
-        """Delete an object by its primary key."""
+        """Delete an object by its primary key with a single DELETE ... RETURNING."""
         result = await session.execute(
-            select(self.model).where(self.model.id == obj_id)  # type: ignore
+            delete(self.model)
+            .where(self.model.id == obj_id)  # type: ignore
+            .returning(self.model.id)  # type: ignore
+            .execution_options(synchronize_session=False)
         )
-        db_obj = result.scalars().first()
-        if not db_obj:
-            return False
-        await session.delete(db_obj)
+        deleted_id = result.scalar_one_or_none()
         await session.commit()
-        return True
+        return deleted_id is not None
 
     async def exists_by_fields(
-        self, session: AsyncSession, field_value_pairs: list[tuple[Any, Any]]
+        self,
+        session: AsyncSession,
+        field_value_pairs: list[tuple[Any, Any]],
+        ignore_case: bool = False,
     ) -> Optional[tuple[Any, Any]]:
         if not field_value_pairs:
             return None
 
-        conditions = [field == value for field, value in field_value_pairs]
+        if ignore_case:
+            conditions = [
+                func.lower(field) == func.lower(value)
+                for field, value in field_value_pairs
+            ]
+        else:
+            conditions = [field == value for field, value in field_value_pairs]
         query = select(self.model).where(or_(*conditions))
         result = await session.execute(query)
         found = result.scalars().first()
@@ -89,7 +131,10 @@ class BaseRepository(Generic[T]):
 
         # Find which field matched
         for field, value in field_value_pairs:
-            if getattr(found, field.key) == value:
+            found_value = getattr(found, field.key)
+            if ignore_case and isinstance(found_value, str) and isinstance(value, str):
+                found_value, value = found_value.lower(), value.lower()
+            if found_value == value:
                 return field, value
 
         return None
@@ -1,17 +1,92 @@
-from typing import List, Optional
+import heapq
+from collections import Counter
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Optional
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Identity,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    case,
+    cast,
+    column,
+    delete,
+    exists,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    text,
+    true,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, REGCONFIG, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.models.part import (
     CollaboratorPermission,
     Part,
     PartCollaborator,
     PartVisibility,
 )
-from app.schemas.part_schema import SortOrder
+from app.schemas.part_schema import SortOrder, TotalMode
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.text import WORD_REGEX, count_words_parallel, word_counts
 
 from .base_repository import BaseRepository
+from .part_word_count_repository import PartWordCountRepository
+
+# Rows per multi-row collaborator statement, well below the bind parameter limit
+COLLABORATOR_BATCH_SIZE = 5000
+
+# Exact totals are memoized briefly so scrolling through pages doesn't recount,
+# the first page of a listing always counts afresh
+part_count_cache = TTLCache(
+    max_size=settings.PART_COUNT_CACHE_MAX_SIZE,
+    ttl=settings.PART_COUNT_CACHE_TTL_SECONDS,
+)
+
+# CSV imports are copied as raw text into this per-connection table, checked in
+# SQL and merged into part. It is dropped with the transaction that created it.
+PART_IMPORT_COLUMNS = (
+    "name",
+    "sku",
+    "description",
+    "weight_ounces",
+    "is_active",
+    "visibility",
+)
+part_import_staging = Table(
+    "part_import_staging",
+    MetaData(),
+    Column("line_no", BigInteger, Identity(always=True), primary_key=True),
+    *(Column(column_name, Text) for column_name in PART_IMPORT_COLUMNS),
+    Column("reject_reason", Text),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+_BOOLEAN_LITERALS = ("true", "false", "t", "f", "yes", "no", "y", "n", "1", "0")
+
+
+def _string_length(column: Column) -> int:
+    """Declared length of a VARCHAR column, staged values are checked against it."""
+    column_type = column.type
+    if not isinstance(column_type, String) or column_type.length is None:
+        raise TypeError(f"{column} has no declared length")
+    return column_type.length
 
 
 class PartRepository(BaseRepository[Part]):
@@ -20,6 +95,83 @@ class PartRepository(BaseRepository[Part]):
     def __init__(self):
         """Initialize with Part model."""
         super().__init__(Part)
+        self.word_count_repository = PartWordCountRepository()
+
+    def _table(self) -> Table:
+        """The part Table, which unlike __table__ is typed as a Table."""
+        return self.model.metadata.tables[self.model.__tablename__]
+
+    async def create(self, session: AsyncSession, obj_in: Any) -> Part:
+        """Create a part, counting its description words in the same transaction."""
+        data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump()
+        await self.word_count_repository.apply_deltas(
+            session, word_counts(data.get("description"))
+        )
+
+        return await super().create(session, data)
+
+    async def update(
+        self, session: AsyncSession, obj_id: Any, obj_in: Any
+    ) -> Optional[Part]:
+        """
+        Update a part with a single UPDATE ... RETURNING. A description change
+        reads the old description from a locking CTE in the same statement and
+        moves its word counts before committing.
+        """
+        data = (
+            obj_in
+            if isinstance(obj_in, dict)
+            else obj_in.model_dump(exclude_unset=True)
+        )
+        if "description" not in data:
+            return await super().update(session, obj_id, data)
+
+        current = (
+            select(self.model.id, self.model.description)
+            .where(self.model.id == obj_id)
+            .with_for_update()
+            .cte("current")
+        )
+        result = await session.execute(
+            update(self.model)
+            .where(self.model.id == current.c.id)
+            .values(**data)
+            .returning(self.model, current.c.description)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        row = result.first()
+        if row is None:
+            await session.commit()
+            return None
+        part, old_description = row
+        deltas = word_counts(data["description"])
+        deltas.subtract(word_counts(old_description))
+        await self.word_count_repository.apply_deltas(session, deltas)
+        await session.commit()
+
+        return part
+
+    async def delete(self, session: AsyncSession, obj_id: Any) -> bool:
+        """
+        Delete a part with a single DELETE ... RETURNING description and
+        discount its words before committing.
+        """
+        result = await session.execute(
+            delete(self.model)
+            .where(self.model.id == obj_id)
+            .returning(self.model.description)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.first()
+        if row is None:
+            await session.commit()
+            return False
+        deltas: Counter[str] = Counter()
+        deltas.subtract(word_counts(row.description))
+        await self.word_count_repository.apply_deltas(session, deltas)
+        await session.commit()
+
+        return True
 
     async def get_by_sku(self, session: AsyncSession, sku: str) -> Optional[Part]:
         """Retrieve a part by its SKU."""
@@ -27,6 +179,393 @@ class PartRepository(BaseRepository[Part]):
 
         return result.scalars().first()
 
+    async def get_version(self, session: AsyncSession, part_id: str):
+        """Fetch only the columns needed to check access to a part and its ETag."""
+        result = await session.execute(
+            select(
+                self.model.id,
+                self.model.owner_id,
+                self.model.visibility,
+                self.model.updated_at,
+            ).where(self.model.id == part_id)
+        )
+
+        return result.first()
+
+    async def get_existing_skus(self, session: AsyncSession, skus: List[str]) -> set:
+        """Return which of the given SKUs are already taken, in a single query."""
+        if not skus:
+            return set()
+        result = await session.execute(
+            select(self.model.sku).where(self.model.sku.in_(skus))
+        )
+
+        return set(result.scalars().all())
+
+    async def bulk_create(
+        self, session: AsyncSession, rows: List[dict]
+    ) -> dict[str, Part]:
+        """
+        Insert many parts with multi-row INSERT ... RETURNING, skipping SKU conflicts.
+        Does not commit, the caller decides if the batch is kept.
+        Returns the created parts by SKU.
+        """
+        if not rows:
+            return {}
+        result = await session.scalars(
+            insert(self.model)
+            .on_conflict_do_nothing(index_elements=[self.model.sku])
+            .returning(self.model),
+            rows,
+        )
+        created = {part.sku: part for part in result.all()}
+
+        deltas: Counter[str] = Counter()
+        for part in created.values():
+            deltas.update(word_counts(part.description))
+        await self.word_count_repository.apply_deltas(session, deltas)
+
+        return created
+
+    async def get_access_map(
+        self, session: AsyncSession, part_ids: List[Any], access_condition=None
+    ) -> dict:
+        """
+        Map each existing part id to whether access_condition holds for it,
+        resolved for the whole set in one query. Missing ids are left out.
+        """
+        if not part_ids:
+            return {}
+        has_access = access_condition if access_condition is not None else true()
+        result = await session.execute(
+            select(self.model.id, has_access).where(self.model.id.in_(part_ids))
+        )
+
+        return {part_id: bool(allowed) for part_id, allowed in result.all()}
+
+    async def bulk_update(
+        self, session: AsyncSession, conditions: list, values: dict
+    ) -> List[Any]:
+        """
+        Set-based UPDATE of every part matching conditions, returns their ids.
+        A description change also returns the old descriptions, read from a
+        locking CTE, to move their word counts.
+        """
+        if "description" not in values:
+            result = await session.execute(
+                update(self.model)
+                .where(*conditions)
+                .values(**values)
+                .returning(self.model.id)
+            )
+            updated_ids = list(result.scalars().all())
+            await session.commit()
+
+            return updated_ids
+
+        targets = (
+            select(self.model.id, self.model.description)
+            .where(*conditions)
+            .with_for_update()
+            .cte("targets")
+        )
+        result = await session.execute(
+            update(self.model)
+            .where(self.model.id == targets.c.id)
+            .values(**values)
+            .returning(self.model.id, targets.c.description)
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        updated_ids = [part_id for part_id, _ in rows]
+
+        new_counts = word_counts(values["description"])
+        deltas = Counter(
+            {word: count * len(rows) for word, count in new_counts.items()}
+        )
+        for _, old_description in rows:
+            deltas.subtract(word_counts(old_description))
+        await self.word_count_repository.apply_deltas(session, deltas)
+        await session.commit()
+
+        return updated_ids
+
+    async def bulk_delete(
+        self, session: AsyncSession, conditions: list
+    ) -> tuple[List[Any], set[str]]:
+        """
+        Set-based DELETE of every part matching conditions together with their
+        collaborator rows. Returns the deleted ids and the ids of the users the
+        parts were shared with.
+        """
+        targets = select(self.model.id).where(*conditions)
+        collaborator_ids = await self.remove_collaborators_of(session, targets)
+        result = await session.execute(
+            delete(self.model)
+            .where(self.model.id.in_(targets))
+            .returning(self.model.id, self.model.description)
+            .execution_options(synchronize_session=False)
+        )
+        deleted_ids = []
+        deltas: Counter[str] = Counter()
+        for part_id, description in result.all():
+            deleted_ids.append(part_id)
+            deltas.subtract(word_counts(description))
+        await self.word_count_repository.apply_deltas(session, deltas)
+        await session.commit()
+
+        return deleted_ids, collaborator_ids
+
+    async def stage_import(
+        self,
+        session: AsyncSession,
+        chunks: AsyncIterator[bytes],
+        columns: List[str],
+    ) -> int:
+        """
+        COPY a CSV body (without header) into the staging table through the raw
+        asyncpg connection, returns the number of rows copied.
+        """
+        connection = await session.connection()
+        await connection.run_sync(part_import_staging.create)
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if driver_connection is None:
+            raise RuntimeError("COPY needs an open asyncpg connection")
+        status_message = await driver_connection.copy_to_table(
+            part_import_staging.name, source=chunks, columns=columns, format="csv"
+        )
+        # Temp tables are never auto analyzed, the checks below join on it
+        await session.execute(text(f"ANALYZE {part_import_staging.name}"))
+
+        return int(status_message.split()[-1])
+
+    async def validate_import(self, session: AsyncSession, owner_id: str) -> None:
+        """
+        Flag staged rows that can't be merged, setting their reject_reason.
+        Only rejected rows are written, valid ones are left untouched.
+        """
+        staged = part_import_staging.c
+        sku = func.btrim(staged.sku)
+        name = func.btrim(staged.name)
+        columns = self._table().c
+        name_length = _string_length(columns.name)
+        sku_length = _string_length(columns.sku)
+        description_length = _string_length(columns.description)
+        reason = case(
+            (func.coalesce(name, "") == "", "name is required"),
+            (func.coalesce(sku, "") == "", "sku is required"),
+            (
+                func.char_length(name) > name_length,
+                f"name is longer than {name_length} characters",
+            ),
+            (
+                func.char_length(sku) > sku_length,
+                f"sku is longer than {sku_length} characters",
+            ),
+            (
+                func.char_length(staged.description) > description_length,
+                f"description is longer than {description_length} characters",
+            ),
+            (
+                ~func.coalesce(staged.weight_ounces, "").regexp_match(
+                    r"^\s*[+-]?\d{1,9}\s*$"
+                ),
+                "weight_ounces must be an integer",
+            ),
+            (
+                func.lower(func.btrim(staged.is_active)).not_in(_BOOLEAN_LITERALS),
+                "is_active must be a boolean",
+            ),
+            (
+                func.upper(func.btrim(staged.visibility)).not_in(
+                    [visibility.value for visibility in PartVisibility]
+                ),
+                (
+                    "visibility must be one of "
+                    f"{', '.join(visibility.value for visibility in PartVisibility)}"
+                ),
+            ),
+            (
+                exists().where(self.model.sku == sku, self.model.owner_id != owner_id),
+                "sku belongs to a part owned by another user",
+            ),
+        )
+        await session.execute(
+            update(part_import_staging)
+            .values(reject_reason=reason)
+            .where(reason.is_not(None))
+        )
+
+        # Only the first valid occurrence of a SKU is merged
+        occurrences = (
+            select(
+                staged.line_no,
+                func.row_number()
+                .over(partition_by=sku, order_by=staged.line_no)
+                .label("occurrence"),
+            )
+            .where(staged.reject_reason.is_(None))
+            .subquery()
+        )
+        await session.execute(
+            update(part_import_staging)
+            .values(reject_reason="sku is repeated in the file")
+            .where(
+                staged.line_no == occurrences.c.line_no,
+                occurrences.c.occurrence > 1,
+            )
+        )
+
+    async def get_import_rejections(
+        self, session: AsyncSession, limit: int
+    ) -> tuple[int, List[Any]]:
+        """Return the number of rejected staged rows and the first `limit` of them."""
+        staged = part_import_staging.c
+        rejected_total = (
+            await session.execute(
+                select(func.count()).where(staged.reject_reason.is_not(None))
+            )
+        ).scalar_one()
+        result = await session.execute(
+            select(staged.line_no, func.btrim(staged.sku), staged.reject_reason)
+            .where(staged.reject_reason.is_not(None))
+            .order_by(staged.line_no)
+            .limit(limit)
+        )
+
+        return rejected_total, list(result.all())
+
+    async def merge_import(
+        self, session: AsyncSession, owner_id: str
+    ) -> tuple[int, int]:
+        """
+        Merge valid staged rows into part with INSERT ... ON CONFLICT (sku) and
+        commit. Existing SKUs are only updated when owned by owner_id, returns
+        the (inserted, updated) counts. Word counts move from the locked old
+        descriptions to the merged ones in the same transaction.
+        """
+        staged = part_import_staging.c
+        table = self._table()
+        deltas: Counter[str] = Counter()
+        replaced = await session.stream_scalars(
+            select(table.c.description)
+            .join(part_import_staging, table.c.sku == func.btrim(staged.sku))
+            .where(staged.reject_reason.is_(None), table.c.owner_id == owner_id)
+            .with_for_update(of=table)
+            .execution_options(yield_per=settings.PART_IMPORT_MERGE_BATCH_SIZE)
+        )
+        async for description in replaced:
+            deltas.subtract(word_counts(description))
+
+        rows = select(
+            func.btrim(staged.name),
+            func.btrim(staged.sku),
+            func.coalesce(staged.description, ""),
+            cast(func.btrim(staged.weight_ounces), Integer),
+            func.coalesce(cast(func.btrim(staged.is_active), Boolean), true()),
+            func.coalesce(
+                func.upper(func.btrim(staged.visibility)), PartVisibility.PUBLIC.value
+            ),
+            literal(owner_id, table.c.owner_id.type),
+        ).where(staged.reject_reason.is_(None))
+        stmt = insert(table).from_select(
+            [
+                table.c.name,
+                table.c.sku,
+                table.c.description,
+                table.c.weight_ounces,
+                table.c.is_active,
+                table.c.visibility,
+                table.c.owner_id,
+            ],
+            rows,
+            include_defaults=False,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.sku],
+            set_={
+                "name": stmt.excluded.name,
+                "description": stmt.excluded.description,
+                "weight_ounces": stmt.excluded.weight_ounces,
+                "is_active": stmt.excluded.is_active,
+                "visibility": stmt.excluded.visibility,
+                "updated_at": func.now(),
+            },
+            where=table.c.owner_id == stmt.excluded.owner_id,
+        )
+        # xmax is only zero for freshly inserted row versions
+        merged = await session.stream(
+            stmt.returning(
+                (literal_column("xmax") == literal_column("0")).label("inserted"),
+                table.c.description,
+            ).execution_options(yield_per=settings.PART_IMPORT_MERGE_BATCH_SIZE)
+        )
+        inserted = updated = 0
+        async for is_inserted, description in merged:
+            if is_inserted:
+                inserted += 1
+            else:
+                updated += 1
+            deltas.update(word_counts(description))
+        await self.word_count_repository.apply_deltas(session, deltas)
+        await session.commit()
+
+        return inserted, updated
+
+    async def get_with_permission(
+        self, session: AsyncSession, part_id: str, user_id: Optional[str]
+    ) -> Optional[tuple[Part, Optional[CollaboratorPermission]]]:
+        """
+        Fetch a part together with the collaborator permission of user_id on
+        it, None if they aren't a collaborator, in a single LEFT JOIN query.
+        """
+        # Without a user the join condition is never true
+        query = (
+            select(self.model, PartCollaborator.permission)
+            .outerjoin(
+                PartCollaborator,
+                (PartCollaborator.part_id == self.model.id)
+                & (PartCollaborator.user_id == user_id),
+            )
+            .where(self.model.id == part_id)
+        )
+
+        result = await session.execute(query)
+        row = result.first()
+        if row is None:
+            return None
+
+        return row[0], row[1]
+
+    async def get_collaborator_permissions(
+        self, session: AsyncSession, user_id: str
+    ) -> dict[str, CollaboratorPermission]:
+        """Every part shared with user_id and its permission, keyed by part id."""
+        result = await session.execute(
+            select(PartCollaborator.part_id, PartCollaborator.permission).where(
+                PartCollaborator.user_id == user_id
+            )
+        )
+
+        return {str(part_id): permission for part_id, permission in result.all()}
+
+    async def remove_collaborators_of(
+        self, session: AsyncSession, part_ids: Any
+    ) -> set[str]:
+        """
+        Delete the collaborator rows of part_ids, a list or a subquery, without
+        committing. Returns the ids of the users that lost access.
+        """
+        result = await session.execute(
+            delete(PartCollaborator)
+            .where(PartCollaborator.part_id.in_(part_ids))
+            .returning(PartCollaborator.user_id)
+            .execution_options(synchronize_session=False)
+        )
+
+        return {str(user_id) for user_id in result.scalars().all()}
+
     async def get_collaborator(
         self, session: AsyncSession, part_id: str, user_id: str
     ) -> Optional[PartCollaborator]:
@@ -46,14 +585,73 @@ class PartRepository(BaseRepository[Part]):
         user_id: str,
         permission: CollaboratorPermission,
     ) -> PartCollaborator:
-        collaborator = PartCollaborator(
+        """Add user_id as a collaborator, or change their permission if they are one."""
+        stmt = insert(PartCollaborator).values(
             part_id=part_id, user_id=user_id, permission=permission
         )
-        session.add(collaborator)
+        result = await session.execute(
+            stmt.on_conflict_do_update(
+                constraint="uq_part_collaborator_part_id_user_id",
+                set_={"permission": stmt.excluded.permission, "updated_at": func.now()},
+            )
+            .returning(PartCollaborator)
+            .execution_options(populate_existing=True)
+        )
+        collaborator = result.scalars().one()
         await session.commit()
 
         return collaborator
 
+    async def bulk_upsert_collaborators(
+        self, session: AsyncSession, rows: List[dict]
+    ) -> List[PartCollaborator]:
+        """
+        Add or update many collaborators with multi-row upserts in one
+        transaction. rows hold part_id, user_id and permission, unique per pair.
+        """
+        collaborators: List[PartCollaborator] = []
+        for start in range(0, len(rows), COLLABORATOR_BATCH_SIZE):
+            stmt = insert(PartCollaborator).values(
+                rows[start : start + COLLABORATOR_BATCH_SIZE]
+            )
+            result = await session.execute(
+                stmt.on_conflict_do_update(
+                    constraint="uq_part_collaborator_part_id_user_id",
+                    set_={
+                        "permission": stmt.excluded.permission,
+                        "updated_at": func.now(),
+                    },
+                )
+                .returning(PartCollaborator)
+                .execution_options(populate_existing=True)
+            )
+            collaborators.extend(result.scalars().all())
+        await session.commit()
+
+        return collaborators
+
+    async def bulk_remove_collaborators(
+        self, session: AsyncSession, pairs: List[tuple]
+    ) -> List[PartCollaborator]:
+        """Delete the collaborator rows of (part_id, user_id) pairs, returns them."""
+        removed: List[PartCollaborator] = []
+        for start in range(0, len(pairs), COLLABORATOR_BATCH_SIZE):
+            batch = pairs[start : start + COLLABORATOR_BATCH_SIZE]
+            result = await session.execute(
+                delete(PartCollaborator)
+                .where(
+                    tuple_(PartCollaborator.part_id, PartCollaborator.user_id).in_(
+                        batch
+                    )
+                )
+                .returning(PartCollaborator)
+                .execution_options(synchronize_session=False)
+            )
+            removed.extend(result.scalars().all())
+        await session.commit()
+
+        return removed
+
     async def remove_collaborator(
         self, session: AsyncSession, part_id: str, user_id: str
     ) -> Optional[PartCollaborator]:
@@ -99,24 +697,53 @@ class PartRepository(BaseRepository[Part]):
         result = await session.execute(select(self.model))
         return list(result.scalars().all())
 
-    async def list_filtered(
+    def _collaborator_exists(
+        self, user_id: str, permission: Optional[CollaboratorPermission] = None
+    ):
+        conditions = [
+            PartCollaborator.part_id == self.model.id,
+            PartCollaborator.user_id == user_id,
+        ]
+        if permission:
+            conditions.append(PartCollaborator.permission == permission)
+
+        return select(PartCollaborator.id).where(*conditions).exists()
+
+    def access_filter(self, user_id: str):
+        """Parts a member can see: owned, shared with them or public."""
+        return or_(
+            self.model.owner_id == user_id,
+            self._collaborator_exists(user_id),
+            self.model.visibility == PartVisibility.PUBLIC,
+        )
+
+    def edit_access_filter(self, user_id: str):
+        """Parts a member can edit: owned or shared with EDIT permission."""
+        return or_(
+            self.model.owner_id == user_id,
+            self._collaborator_exists(user_id, CollaboratorPermission.EDIT),
+        )
+
+    def owner_access_filter(self, user_id: str):
+        return self.model.owner_id == user_id
+
+    def filter_conditions(
         self,
-        session: AsyncSession,
         params,
         owner_id: Optional[str] = None,
         collaborator_id: Optional[str] = None,
         public_only: bool = False,
-    ):
-        query = select(self.model)
+        accessible_by: Optional[str] = None,
+    ) -> list:
+        """WHERE conditions shared by every part listing built from query params."""
         filters = []
 
         if owner_id:
             filters.append(self.model.owner_id == owner_id)
         if collaborator_id:
-            query = query.join(
-                PartCollaborator, PartCollaborator.part_id == self.model.id
-            )
-            filters.append(PartCollaborator.user_id == collaborator_id)
+            filters.append(self._collaborator_exists(collaborator_id))
+        if accessible_by:
+            filters.append(self.access_filter(accessible_by))
         if public_only:
             filters.append(self.model.visibility == PartVisibility.PUBLIC)
         if params.visibility:
@@ -131,33 +758,288 @@ class PartRepository(BaseRepository[Part]):
         if params.end_date:
             filters.append(self.model.created_at <= params.end_date)
 
-        if filters:
-            query = query.where(*filters)
+        return filters
 
-        sort_attr = self.model.created_at
+    def _sorting(self, params, source=None):
+        source = self.model if source is None else source
+        sort_attr = source.created_at
         if params.sort_by:
-            sort_attr = getattr(self.model, params.sort_by.value, sort_attr)
-
-        if params.sort_order == SortOrder.desc:
-            order_by_clause = sort_attr.desc()
+            sort_attr = getattr(source, params.sort_by.value, sort_attr)
+        is_desc = params.sort_order == SortOrder.desc
+        if is_desc:
+            order_by = (sort_attr.desc(), source.id.desc())
         else:
-            order_by_clause = sort_attr.asc()
+            order_by = (sort_attr.asc(), source.id.asc())
 
-        query = query.order_by(order_by_clause)
-        query = query.offset(params.offset).limit(params.limit)
+        return sort_attr, is_desc, order_by
+
+    async def list_filtered(
+        self,
+        session: AsyncSession,
+        params,
+        owner_id: Optional[str] = None,
+        collaborator_id: Optional[str] = None,
+        public_only: bool = False,
+        accessible_by: Optional[str] = None,
+    ):
+        filters = self.filter_conditions(params, owner_id, collaborator_id, public_only)
+        query, sort_attr = self.list_query(params, filters, accessible_by)
+        if accessible_by:
+            filters.append(self.access_filter(accessible_by))
 
         result = await session.execute(query)
         items = list(result.scalars().all())
 
-        count_query = select(func.count()).select_from(self.model)
+        next_cursor = None
+        if len(items) > params.limit:
+            items = items[: params.limit]
+            last = items[-1]
+            next_cursor = encode_cursor(
+                sort_attr.key,
+                params.sort_order.value,
+                getattr(last, sort_attr.key),
+                last.id,
+            )
+
+        total = await self._count_filtered(session, filters, params)
+
+        return items, total, next_cursor
+
+    def _accessible_parts(self, filters: list, user_id: str, order_by, limit: int):
+        """
+        The first `limit` parts in order_by matching filters that user_id can
+        see, as the UNION ALL of disjoint owned, public and shared branches.
+        Each branch reads its own first rows off a listing index and Postgres
+        merges them, where access_filter's OR has to fetch and sort every match.
+        """
+        # The generated search_vector is never loaded with a part
+        columns = [column for column in self._table().c if column.computed is None]
+        not_owned = self.model.owner_id != user_id
+        branches = [
+            select(*columns).where(*filters, self.model.owner_id == user_id),
+            select(*columns).where(
+                *filters, not_owned, self.model.visibility == PartVisibility.PUBLIC
+            ),
+            # A user collaborates on a part at most once, the join can't repeat it
+            select(*columns)
+            .join(PartCollaborator, PartCollaborator.part_id == self.model.id)
+            .where(
+                *filters,
+                not_owned,
+                self.model.visibility != PartVisibility.PUBLIC,
+                PartCollaborator.user_id == user_id,
+            ),
+        ]
+        # Ordered and limited per branch, Postgres doesn't push either down into
+        # a UNION ALL and would sort all of them
+        accessible = union_all(
+            *(branch.order_by(*order_by).limit(limit) for branch in branches)
+        )
+
+        return aliased(self.model, accessible.subquery("accessible_part"))
+
+    def list_query(
+        self,
+        params,
+        filters: list,
+        accessible_by: Optional[str] = None,
+    ):
+        """
+        Page query for a listing: filters, keyset or offset and ordering,
+        limited to the parts accessible_by can see when given. Returns the
+        statement and the column it is sorted by.
+        """
+        sort_attr, is_desc, order_by = self._sorting(params)
+
+        if params.cursor:
+            parse_value = (
+                datetime.fromisoformat if isinstance(sort_attr.type, DateTime) else None
+            )
+            cursor_values: tuple[Any, ...] = decode_cursor(
+                params.cursor, sort_attr.key, params.sort_order.value, parse_value
+            )
+            keyset = tuple_(sort_attr, self.model.id)
+            if is_desc:
+                filters = [*filters, keyset < tuple_(*cursor_values)]
+            else:
+                filters = [*filters, keyset > tuple_(*cursor_values)]
+
+        # Seek past the cursor instead of scanning and discarding offset rows
+        offset = 0 if params.cursor else params.offset
+        # One extra row tells us if there is a next page without another query
+        limit = params.limit + 1
+
+        source: Any = self.model
+        if accessible_by:
+            source = self._accessible_parts(
+                filters, accessible_by, order_by, offset + limit
+            )
+            filters = []
+            _, _, order_by = self._sorting(params, source)
+        query = select(source).where(*filters).order_by(*order_by)
+        if not params.cursor:
+            query = query.offset(offset)
+
+        return query.limit(limit), sort_attr
+
+    async def _count_filtered(
+        self, session: AsyncSession, filters: list, params
+    ) -> Optional[int]:
+        if params.total_mode == TotalMode.none:
+            return None
+        if params.total_mode == TotalMode.estimate:
+            return await self.estimate_count(
+                session, select(self.model.id).where(*filters)
+            )
+
+        count_query = select(func.count()).select_from(self.model).where(*filters)
+        # Same filters give the same SQL and params, so that is the cache key
+        compiled = count_query.compile()
+        cache_key = f"{compiled}|{sorted(compiled.params.items())}"
+        # Only pages continuing a scroll reuse a total, a first page recounts so
+        # it always sees writes made since, by this or any other process
+        continues_scroll = bool(params.cursor or params.offset)
+        total = part_count_cache.get(cache_key) if continues_scroll else None
+        if total is None:
+            count_result = await session.execute(count_query)
+            total = count_result.scalar_one()
+            part_count_cache.set(cache_key, total)
+
+        return total
+
+    async def stream_filtered(
+        self,
+        session: AsyncSession,
+        params,
+        chunk_size: int,
+        public_only: bool = False,
+        accessible_by: Optional[str] = None,
+    ) -> AsyncIterator[List[Part]]:
+        """Yield every matching part in chunks read from a server-side cursor."""
+        filters = self.filter_conditions(
+            params, public_only=public_only, accessible_by=accessible_by
+        )
+        _, _, order_by = self._sorting(params)
+        query = (
+            select(self.model)
+            .where(*filters)
+            .order_by(*order_by)
+            .execution_options(yield_per=chunk_size)
+        )
+
+        result = await session.stream(query)
+        async for chunk in result.scalars().partitions():
+            yield list(chunk)
+
+    async def search(
+        self,
+        session: AsyncSession,
+        search_text: str,
+        limit: int,
+        offset: int = 0,
+        accessible_by: Optional[str] = None,
+        public_only: bool = False,
+    ) -> List[Part]:
+        """Ranked full-text search on name/description with fuzzy name matching."""
+        ts_query = func.websearch_to_tsquery(literal("english", REGCONFIG), search_text)
+        # Both predicates are served by the GIN indexes on search_vector and name
+        filters = [
+            or_(
+                self.model.search_vector.op("@@")(ts_query),
+                self.model.name.op("%")(search_text),
+            )
+        ]
+        if accessible_by:
+            filters.append(self.access_filter(accessible_by))
+        if public_only:
+            filters.append(self.model.visibility == PartVisibility.PUBLIC)
+
+        rank = func.ts_rank_cd(self.model.search_vector, ts_query) + func.similarity(
+            self.model.name, search_text
+        )
+        result = await session.execute(
+            select(self.model)
+            .where(*filters)
+            .order_by(rank.desc(), self.model.id)
+            .offset(offset)
+            .limit(limit)
+        )
 
-        if filters:
-            count_query = count_query.where(*filters)
-        count_result = await session.execute(count_query)
-        total = count_result.scalar_one()
+        return list(result.scalars().all())
 
-        return items, total
+    async def top_words(
+        self,
+        session: AsyncSession,
+        params,
+        public_only: bool = False,
+        accessible_by: Optional[str] = None,
+    ) -> List[tuple]:
+        """
+        The `params.n` most frequent description words among the matching
+        parts as (word, count). Postgres splits and counts the words with the
+        pattern of app.utils.text, only case folding is left to Python.
+        """
+        filters = self.filter_conditions(
+            params,
+            owner_id=params.owner_id,
+            public_only=public_only,
+            accessible_by=accessible_by,
+        )
+        # One row per word occurrence
+        matches = (
+            func.regexp_matches(self.model.description, WORD_REGEX, "g")
+            .table_valued(column("match", ARRAY(Text)))
+            .render_derived()
+            .lateral("matches")
+        )
+        # Under "C" lower() only folds ASCII whatever the locale, which merges
+        # most case variants before they are sent. str.lower folds the rest.
+        word = func.lower(matches.c.match[1].collate("C"))
+        query = (
+            select(word, func.count())
+            .select_from(self.model)
+            .join(matches, true())
+            .where(*filters)
+            .group_by(word)
+        )
+
+        counts: Counter[str] = Counter()
+        result = await session.stream(query)
+        async for ascii_folded, occurrences in result:
+            counts[ascii_folded.lower()] += occurrences
+
+        return heapq.nsmallest(
+            params.n, counts.items(), key=lambda item: (-item[1], item[0])
+        )
+
+    async def stream_descriptions(
+        self, session: AsyncSession, chunk_size: int
+    ) -> AsyncIterator[List[Optional[str]]]:
+        """Yield every description in chunks read from a server-side cursor."""
+        result = await session.stream(
+            select(self.model.description).execution_options(yield_per=chunk_size)
+        )
+        async for chunk in result.scalars().partitions():
+            yield list(chunk)
+
+    async def rebuild_word_counts(
+        self,
+        session: AsyncSession,
+        chunk_size: int,
+        workers: Optional[int] = None,
+    ) -> int:
+        """
+        Recompute the word frequency index from every description, tokenized
+        on a process pool. Part writes are blocked until the commit so no
+        delta lands between the read and the replace. Returns the number of
+        distinct words.
+        """
+        await session.execute(text("LOCK TABLE part IN SHARE MODE"))
+        counts = await count_words_parallel(
+            self.stream_descriptions(session, chunk_size), workers=workers
+        )
+
+        await self.word_count_repository.replace_all(session, counts)
+        await session.commit()
 
-    async def get_all_descriptions(self, session: AsyncSession) -> list[str]:
-        result = await session.execute(select(self.model.description))
-        return [desc for desc in result.scalars().all() if desc]
+        return len(counts)
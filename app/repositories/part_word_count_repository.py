@@ -0,0 +1,86 @@
+from collections import Counter
+from typing import Iterable, List
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.part_word_count import PartWordCount
+
+from .base_repository import BaseRepository
+
+# Keeps every statement well below the bind parameter limit of Postgres
+WORD_BATCH_SIZE = 5000
+
+
+def _batches(items: List, size: int = WORD_BATCH_SIZE) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class PartWordCountRepository(BaseRepository[PartWordCount]):
+    """
+    Repository for the word frequency index of part descriptions. Writes never
+    commit, they belong to the transaction of the part write they mirror.
+    """
+
+    def __init__(self):
+        """Initialize with PartWordCount model."""
+        super().__init__(PartWordCount)
+
+    async def apply_deltas(self, session: AsyncSession, deltas: Counter) -> None:
+        """
+        Add signed per-word deltas with an upsert and drop words that reach 0.
+        Words are written in sorted order so concurrent writers lock rows in the
+        same order and can't deadlock.
+        """
+        changes = sorted((word, delta) for word, delta in deltas.items() if delta)
+        for batch in _batches(changes):
+            stmt = insert(self.model).values(
+                [{"word": word, "count": delta} for word, delta in batch]
+            )
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[self.model.word],
+                    set_={
+                        "count": self.model.count + stmt.excluded.count,
+                        "updated_at": func.now(),
+                    },
+                )
+            )
+
+        decreased = [word for word, delta in changes if delta < 0]
+        for batch in _batches(decreased):
+            await session.execute(
+                delete(self.model).where(
+                    self.model.word.in_(batch), self.model.count <= 0
+                )
+            )
+
+    async def replace_all(self, session: AsyncSession, counts: Counter) -> None:
+        """Replace the whole index with counts, used by the rebuild command."""
+        await session.execute(delete(self.model))
+        rows = sorted(counts.items())
+        for batch in _batches(rows):
+            await session.execute(
+                insert(self.model).values(
+                    [{"word": word, "count": count} for word, count in batch]
+                )
+            )
+
+    async def get_top(self, session: AsyncSession, limit: int) -> List[tuple]:
+        """The `limit` most frequent words as (word, count), read off the index."""
+        result = await session.execute(
+            select(self.model.word, self.model.count)
+            .order_by(self.model.count.desc(), self.model.word)
+            .limit(limit)
+        )
+
+        return [(word, count) for word, count in result.all()]
+
+    async def get_counts(self, session: AsyncSession, words: List[str]) -> dict:
+        result = await session.execute(
+            select(self.model.word, self.model.count).where(self.model.word.in_(words))
+        )
+
+        return {word: count for word, count in result.all()}
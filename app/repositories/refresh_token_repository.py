@@ -0,0 +1,93 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.refresh_token import RefreshToken
+
+from .base_repository import BaseRepository
+
+
+class RefreshTokenRepository(BaseRepository[RefreshToken]):
+    """Repository for refresh tokens, looked up by the hash of the token."""
+
+    def __init__(self):
+        """Initialize with RefreshToken model."""
+        super().__init__(RefreshToken)
+
+    async def rotate(
+        self,
+        session: AsyncSession,
+        token_hash: str,
+        new_token_hash: str,
+        expires_at: datetime,
+    ) -> Optional[Any]:
+        """
+        Revoke a live token and store its replacement in one transaction.
+        The conditional UPDATE lets only one of two concurrent refreshes with
+        the same token win. Returns the user id, None if the token isn't live.
+        """
+        result = await session.execute(
+            update(self.model)
+            .where(
+                self.model.token_hash == token_hash,
+                self.model.revoked.is_(False),
+                self.model.expires_at > func.now(),
+            )
+            .values(revoked=True, updated_at=func.now())
+            .returning(self.model.user_id)
+        )
+        user_id = result.scalar_one_or_none()
+        if user_id is None:
+            await session.rollback()
+            return None
+
+        session.add(
+            self.model(
+                token_hash=new_token_hash, user_id=user_id, expires_at=expires_at
+            )
+        )
+        await session.execute(self._expired(user_id))
+        await session.commit()
+
+        return user_id
+
+    def _expired(self, user_id: Optional[Any] = None):
+        """
+        DELETE of expired tokens, revoked or not. Revoked tokens are kept until
+        then, so presenting one can still be detected as a reuse.
+        """
+        stmt = delete(self.model).where(self.model.expires_at <= func.now())
+        if user_id is not None:
+            stmt = stmt.where(self.model.user_id == user_id)
+        return stmt
+
+    async def purge_expired(self, session: AsyncSession) -> int:
+        """
+        Delete the expired tokens of every user, returns how many were deleted.
+        Rotation only purges the tokens of the user refreshing.
+        """
+        result = await session.execute(self._expired())
+        await session.commit()
+
+        return result.rowcount
+
+    async def get_by_hash(
+        self, session: AsyncSession, token_hash: str
+    ) -> Optional[RefreshToken]:
+        result = await session.execute(
+            select(self.model).where(self.model.token_hash == token_hash)
+        )
+        return result.scalars().first()
+
+    async def revoke_all(self, session: AsyncSession, user_id: Any) -> int:
+        """Revoke every live token of a user, returns how many were revoked."""
+        result = await session.execute(
+            update(self.model)
+            .where(self.model.user_id == user_id, self.model.revoked.is_(False))
+            .values(revoked=True, updated_at=func.now())
+        )
+        await session.commit()
+
+        return result.rowcount
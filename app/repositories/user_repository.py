@@ -1,7 +1,7 @@
 from typing import List, Optional
 
 from pydantic import EmailStr
-from sqlalchemy import select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
@@ -35,6 +35,43 @@ class UserRepository(BaseRepository[User]):
         )
         return result.scalars().first()
 
+    def identifier_query(self, identifier: str):
+        """
+        Select the user with a username or email equal to identifier, ignoring
+        case. A username match wins over an email match, then an exact match,
+        then the lowest id so the pick never depends on the plan.
+        """
+        identifier_lower = func.lower(identifier)
+        username_match = func.lower(self.model.username) == identifier_lower
+        return (
+            select(self.model)
+            .where(
+                or_(username_match, func.lower(self.model.email) == identifier_lower)
+            )
+            .order_by(
+                username_match.desc(),
+                or_(
+                    self.model.username == identifier, self.model.email == identifier
+                ).desc(),
+                self.model.id,
+            )
+            .limit(1)
+        )
+
+    async def get_by_identifier(
+        self, session: AsyncSession, identifier: str
+    ) -> Optional[User]:
+        """Retrieve a user by username or email in one indexed query."""
+        result = await session.execute(self.identifier_query(identifier))
+        return result.scalars().first()
+
+    async def get_existing_ids(self, session: AsyncSession, user_ids: List) -> set:
+        """The subset of user_ids that belong to a user."""
+        result = await session.execute(
+            select(self.model.id).where(self.model.id.in_(user_ids))
+        )
+        return set(result.scalars().all())
+
     async def create_user(self, session: AsyncSession, user: UserCreate) -> User:
         """Create a new user from a UserCreate Pydantic schema."""
         user_data = user.model_dump()
@@ -3,7 +3,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from app.models.part import CollaboratorPermission, PartVisibility
 
@@ -57,16 +57,141 @@ class PartResponse(PartBase):
     model_config = {"from_attributes": True}
 
 
+class PartBulkItemStatus(str, Enum):
+    created = "created"
+    conflict = "conflict"
+
+
+class PartBulkItemResult(BaseModel):
+    """Outcome of one item of a bulk request, index is its position in the request."""
+
+    index: int
+    sku: str
+    status: PartBulkItemStatus
+    part: Optional[PartResponse] = None
+    detail: Optional[str] = None
+
+
+class PartBulkCreateResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[PartBulkItemResult]
+
+
+class PartBulkFilter(PartFieldValidatorMixin, BaseModel):
+    """Filter expression selecting parts for a bulk operation."""
+
+    visibility: Optional[PartVisibility] = None
+    is_active: Optional[bool] = None
+    name: Optional[List[str]] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def require_condition(self):
+        """An empty filter would select every part, ask for it explicitly instead."""
+        if not self.model_fields_set:
+            raise ValueError("filter needs at least one condition")
+        return self
+
+
+class PartBulkSelection(BaseModel):
+    """Parts targeted by a bulk operation, either by ids or by a filter."""
+
+    ids: Optional[List[uuid.UUID]] = Field(default=None, max_length=5000)
+    filter: Optional[PartBulkFilter] = None
+
+    @model_validator(mode="after")
+    def require_one_selector(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide either ids or filter")
+        return self
+
+
+class PartBulkChanges(PartFieldValidatorMixin, BaseModel):
+    """Fields that can be set on many parts at once (sku is unique per part)."""
+
+    model_config = {"extra": "forbid"}
+
+    name: Optional[str] = None
+    description: Optional[str] = None
+    weight_ounces: Optional[int] = None
+    is_active: Optional[bool] = None
+    visibility: Optional[PartVisibility] = None
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def reject_null(cls, v):
+        """Fields are optional to leave out, but every column is NOT NULL."""
+        if v is None:
+            raise ValueError("may be omitted but not null")
+        return v
+
+
+class PartBulkUpdate(PartBulkSelection):
+    changes: PartBulkChanges
+
+
+class PartBulkDelete(PartBulkSelection):
+    pass
+
+
+class PartBulkResult(BaseModel):
+    affected: int
+    ids: List[uuid.UUID]
+
+
+class PartImportRejectedRow(BaseModel):
+    row: int
+    sku: Optional[str] = None
+    reason: str
+
+
+class PartImportResponse(BaseModel):
+    """Outcome of a CSV import, only the first rejected rows are listed."""
+
+    total: int
+    inserted: int
+    updated: int
+    skipped: int
+    rejected: int
+    rejected_rows: List[PartImportRejectedRow]
+
+
 class PartCollaboratorResponse(BaseModel):
     """Schema for returning a Part Collaborator."""
 
-    part_id: str
-    user_id: str
+    part_id: uuid.UUID
+    user_id: uuid.UUID
     permission: CollaboratorPermission
 
     model_config = {"from_attributes": True}
 
 
+class PartCollaboratorPair(BaseModel):
+    part_id: uuid.UUID
+    user_id: uuid.UUID
+
+
+class PartCollaboratorGrant(PartCollaboratorPair):
+    permission: CollaboratorPermission = CollaboratorPermission.READ
+
+
+class PartCollaboratorBulkGrant(BaseModel):
+    """(part, user) pairs to share, a pair listed twice keeps its last permission."""
+
+    collaborators: List[PartCollaboratorGrant] = Field(min_length=1, max_length=10000)
+
+
+class PartCollaboratorBulkRevoke(BaseModel):
+    collaborators: List[PartCollaboratorPair] = Field(min_length=1, max_length=10000)
+
+
+class PartCollaboratorBulkResult(BaseModel):
+    affected: int
+    collaborators: List[PartCollaboratorResponse]
+
+
 class PartUpdateForCollaborators(BaseModel):
     """Schema for updating a Part by collaborators (excluding is_active and visibility fields)."""
 
@@ -76,6 +201,16 @@ class PartUpdateForCollaborators(BaseModel):
     weight_ounces: Optional[int] = None
 
 
+class EffectivePermission(str, Enum):
+    """What a user may do with a part, strongest first."""
+
+    admin = "admin"
+    owner = "owner"
+    edit = "edit"
+    read = "read"
+    none = "none"
+
+
 class PartSortBy(str, Enum):
     visibility = "visibility"
     is_active = "is_active"
@@ -89,6 +224,17 @@ class SortOrder(str, Enum):
     desc = "desc"
 
 
+class TotalMode(str, Enum):
+    exact = "exact"
+    estimate = "estimate"
+    none = "none"
+
+
+class PartExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
 class PartListQueryParams(BaseModel):
     visibility: Optional[PartVisibility] = None
     is_active: Optional[bool] = None
@@ -99,11 +245,24 @@ class PartListQueryParams(BaseModel):
     sort_order: Optional[SortOrder] = SortOrder.desc
     limit: Optional[int] = Field(default=20, ge=1, le=100)
     offset: Optional[int] = Field(default=0, ge=0)
+    cursor: Optional[str] = None
+    total_mode: Optional[TotalMode] = TotalMode.exact
 
 
 class PartPaginatedResponse(BaseModel):
     items: List[PartResponse]
-    total: int
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+class TopWordsQueryParams(PartFieldValidatorMixin, BaseModel):
+    n: int = Field(default=5, ge=1, le=100)
+    visibility: Optional[PartVisibility] = None
+    owner_id: Optional[uuid.UUID] = None
+    is_active: Optional[bool] = None
+    name: Optional[List[str]] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
 
 
 class WordFrequencyResponse(BaseModel):
@@ -1,3 +1,4 @@
+import uuid
 from enum import StrEnum
 from typing import Optional
 
@@ -11,7 +12,13 @@ class TokenType(StrEnum):
 class Token(BaseModel):
     access_token: str
     token_type: TokenType
+    refresh_token: Optional[str] = None
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
 
 
 class TokenData(BaseModel):
     username: Optional[str] = None
+    user_id: Optional[uuid.UUID] = None
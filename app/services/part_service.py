@@ -1,28 +1,81 @@
-import re
+import csv
+import hashlib
+import io
+import json
+import uuid
 from collections import Counter
-from typing import Optional
+from typing import Any, AsyncIterator, List, Optional
 
-from fastapi import HTTPException, status
+from asyncpg.exceptions import DataError  # type: ignore[import-untyped]
+from fastapi import HTTPException, UploadFile, status
 from loguru import logger
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.core.cache import cache_backend
+from app.core.config import settings
 from app.models.part import CollaboratorPermission, Part, PartVisibility
 from app.models.user import User, UserRole
-from app.repositories.part_repository import PartRepository
+from app.repositories.part_repository import PART_IMPORT_COLUMNS, PartRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas.part_schema import (
+    EffectivePermission,
+    PartBulkCreateResponse,
+    PartBulkDelete,
+    PartBulkItemResult,
+    PartBulkItemStatus,
+    PartBulkResult,
+    PartBulkSelection,
+    PartBulkUpdate,
+    PartCollaboratorBulkGrant,
+    PartCollaboratorBulkResult,
+    PartCollaboratorBulkRevoke,
     PartCollaboratorResponse,
     PartCreate,
+    PartExportFormat,
+    PartImportRejectedRow,
+    PartImportResponse,
     PartListQueryParams,
     PartPaginatedResponse,
     PartResponse,
     PartUpdate,
     PartUpdateForCollaborators,
+    TopWordsQueryParams,
     TopWordsResponse,
     WordFrequencyResponse,
 )
+from app.utils.etag import part_etag
 from app.utils.validation import raise_if_duplicate
 
+# Single parts are cached under this prefix plus their id, every write path
+# below drops the parts it touched
+PART_CACHE_PREFIX = "part:"
+
+
+def _part_cache_key(part_id) -> str:
+    # Normalized so "ABC-..." and "abc-..." can't be cached apart
+    try:
+        return f"{PART_CACHE_PREFIX}{uuid.UUID(str(part_id))}"
+    except ValueError:
+        return f"{PART_CACHE_PREFIX}{part_id}"
+
+
+# The parts shared with a user and their permission, {part_id: permission},
+# dropped whenever one of the user's collaborator rows changes
+COLLABORATOR_PERMISSIONS_CACHE_PREFIX = "collaborator-permissions:"
+
+
+def _collaborator_permissions_cache_key(user_id) -> str:
+    return f"{COLLABORATOR_PERMISSIONS_CACHE_PREFIX}{uuid.UUID(str(user_id))}"
+
+
+# A token set before the permissions are read and dropped with them. A fill
+# only counts while its token is current, so one that read the database
+# before a revoke committed can't cache the revoked grant.
+def _collaborator_permissions_generation_key(user_id) -> str:
+    return (
+        f"{COLLABORATOR_PERMISSIONS_CACHE_PREFIX}generation:{uuid.UUID(str(user_id))}"
+    )
+
 
 class PartService:
     def __init__(self) -> None:
@@ -41,10 +94,111 @@ class PartService:
 
         return PartResponse.model_validate(part)
 
+    def _effective_permission(
+        self,
+        part: PartResponse,
+        user: Optional[User],
+        collaborator_permission: Optional[CollaboratorPermission],
+    ) -> EffectivePermission:
+        if user is None:
+            return EffectivePermission.none
+        if user.role == UserRole.ADMIN:
+            return EffectivePermission.admin
+        if str(part.owner_id) == str(user.id):
+            return EffectivePermission.owner
+        if collaborator_permission == CollaboratorPermission.EDIT:
+            return EffectivePermission.edit
+        if collaborator_permission == CollaboratorPermission.READ:
+            return EffectivePermission.read
+        return EffectivePermission.none
+
+    async def _get_part_with_permission_or_404(
+        self, session: AsyncSession, part_id: str, user: Optional[User]
+    ) -> tuple[PartResponse, EffectivePermission]:
+        """Get a part by ID and what user may do with it in one query, or 404."""
+        row = await self.part_repository.get_with_permission(
+            session, part_id, str(user.id) if user else None
+        )
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Part not found"
+            )
+        part, collaborator_permission = row
+        part_response = PartResponse.model_validate(part)
+
+        return part_response, self._effective_permission(
+            part_response, user, collaborator_permission
+        )
+
+    async def _invalidate_parts(self, part_ids) -> None:
+        await cache_backend.delete(*(_part_cache_key(part_id) for part_id in part_ids))
+
+    async def _get_collaborator_permissions(
+        self, session: AsyncSession, user: User
+    ) -> dict[str, CollaboratorPermission]:
+        """Parts shared with user and their permission, served from the cache."""
+        cache_key = _collaborator_permissions_cache_key(user.id)
+        generation_key = _collaborator_permissions_generation_key(user.id)
+        cached = await cache_backend.get(cache_key)
+        generation = await cache_backend.get(generation_key)
+        # Entries cached before generations existed have none and miss
+        if cached is not None and cached.get("generation") == generation:
+            return {
+                part_id: CollaboratorPermission(permission)
+                for part_id, permission in cached["permissions"].items()
+            }
+
+        # Set before reading, an invalidation from here on drops it
+        if generation is None:
+            generation = uuid.uuid4().hex
+            await cache_backend.set(
+                generation_key, generation, settings.PERMISSION_CACHE_TTL_SECONDS
+            )
+        permissions = await self.part_repository.get_collaborator_permissions(
+            session, str(user.id)
+        )
+        await cache_backend.set(
+            cache_key,
+            {
+                "generation": generation,
+                "permissions": {
+                    part_id: permission.value
+                    for part_id, permission in permissions.items()
+                },
+            },
+            settings.PERMISSION_CACHE_TTL_SECONDS,
+        )
+
+        return permissions
+
+    async def _invalidate_collaborator_permissions(self, user_ids) -> None:
+        """Called after the write commits, see the generation key."""
+        await cache_backend.delete(
+            *(
+                key
+                for user_id in user_ids
+                for key in (
+                    _collaborator_permissions_cache_key(user_id),
+                    _collaborator_permissions_generation_key(user_id),
+                )
+            )
+        )
+
+    def _visibility_scope(self, user: Optional[User]) -> dict:
+        """Listing filters that restrict parts to what the user is allowed to see."""
+        if user and user.role == UserRole.ADMIN:
+            return {}
+        if user:
+            return {"accessible_by": str(user.id)}
+        return {"public_only": True}
+
     async def _check_part_access(
         self, session: AsyncSession, part: PartResponse, user: Optional[User]
     ) -> None:
-        """Check if user has access to part, raise 403 if not."""
+        """
+        Check if user has access to part, raise 403 if not. Only id, owner_id and
+        visibility are read, so a partial row works too.
+        """
         if part.visibility == PartVisibility.PUBLIC:
             return
         if user is None:
@@ -53,24 +207,31 @@ class PartService:
             )
         if user.role == UserRole.ADMIN or str(part.owner_id) == str(user.id):
             return
-        collaborator = await self.part_repository.get_collaborator(
-            session, str(part.id), str(user.id)
-        )
-        if not collaborator:
+        permissions = await self._get_collaborator_permissions(session, user)
+        if str(part.id) not in permissions:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized"
             )
 
-    async def _check_part_edit_access(
-        self, session: AsyncSession, part: PartResponse, user: User
+    def _check_part_read_permission(
+        self, part: PartResponse, permission: EffectivePermission
     ) -> None:
-        """Check if user has edit access to part, raise 403 if not."""
-        if user.role == UserRole.ADMIN or str(part.owner_id) == str(user.id):
-            return
-        collaborator = await self.part_repository.get_collaborator(
-            session, str(part.id), str(user.id)
-        )
-        if not collaborator or collaborator.permission != CollaboratorPermission.EDIT:
+        """Raise 403 unless the part is public or the user has any permission."""
+        if (
+            part.visibility != PartVisibility.PUBLIC
+            and permission == EffectivePermission.none
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized"
+            )
+
+    def _check_part_edit_permission(self, permission: EffectivePermission) -> None:
+        """Raise 403 unless the user is an admin, the owner or an EDIT collaborator."""
+        if permission not in (
+            EffectivePermission.admin,
+            EffectivePermission.owner,
+            EffectivePermission.edit,
+        ):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized"
             )
@@ -99,28 +260,360 @@ class PartService:
         logger.info(f"Part created with id={part.id}")
         return PartResponse.model_validate(part)
 
+    async def create_parts_bulk(
+        self,
+        session: AsyncSession,
+        parts_data: List[PartCreate],
+        owner: User,
+        partial: bool = False,
+    ) -> PartBulkCreateResponse:
+        """
+        Create many parts in one transaction. Without `partial` any SKU conflict
+        rejects the whole batch, with it the conflicting items are skipped.
+        """
+        logger.info(
+            f"Bulk creating {len(parts_data)} parts for user_id={owner.id} "
+            f"with partial={partial}"
+        )
+        existing_skus = await self.part_repository.get_existing_skus(
+            session, [part_data.sku for part_data in parts_data]
+        )
+
+        results: dict[int, PartBulkItemResult] = {}
+        rows = []
+        batch_skus = set()
+        for index, part_data in enumerate(parts_data):
+            detail = None
+            if part_data.sku in existing_skus:
+                detail = "A Part with this sku already exists."
+            elif part_data.sku in batch_skus:
+                detail = "This sku is repeated in the request."
+            if detail:
+                results[index] = PartBulkItemResult(
+                    index=index,
+                    sku=part_data.sku,
+                    status=PartBulkItemStatus.conflict,
+                    detail=detail,
+                )
+                continue
+            batch_skus.add(part_data.sku)
+            rows.append({**part_data.model_dump(), "owner_id": str(owner.id)})
+
+        if results and not partial:
+            self._raise_bulk_conflict(results.values())
+
+        created = await self.part_repository.bulk_create(session, rows)
+        for index, part_data in enumerate(parts_data):
+            if index in results:
+                continue
+            part = created.get(part_data.sku)
+            if part is None:
+                # Taken by a concurrent request after our duplicate check
+                results[index] = PartBulkItemResult(
+                    index=index,
+                    sku=part_data.sku,
+                    status=PartBulkItemStatus.conflict,
+                    detail="A Part with this sku already exists.",
+                )
+            else:
+                results[index] = PartBulkItemResult(
+                    index=index,
+                    sku=part_data.sku,
+                    status=PartBulkItemStatus.created,
+                    part=PartResponse.model_validate(part),
+                )
+
+        if len(created) != len(rows) and not partial:
+            await session.rollback()
+            self._raise_bulk_conflict(
+                r for r in results.values() if r.status == PartBulkItemStatus.conflict
+            )
+        await session.commit()
+        logger.info(f"Bulk created {len(created)} parts for user_id={owner.id}")
+
+        return PartBulkCreateResponse(
+            created=len(created),
+            failed=len(parts_data) - len(created),
+            results=[results[index] for index in range(len(parts_data))],
+        )
+
+    def _raise_bulk_conflict(self, conflicts) -> None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=[conflict.model_dump(mode="json") for conflict in conflicts],
+        )
+
+    async def _read_import_header(
+        self, upload: UploadFile
+    ) -> tuple[List[str], AsyncIterator[bytes]]:
+        """
+        Read the CSV header line and return its columns together with an
+        iterator over the rest of the upload, so the body can be streamed to COPY.
+        """
+        chunk_size = settings.PART_IMPORT_CHUNK_SIZE_BYTES
+        buffer = b""
+        while b"\n" not in buffer:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            buffer += chunk
+            if len(buffer) > chunk_size and b"\n" not in buffer:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="CSV header line is too long",
+                )
+        header_line, _, rest = buffer.partition(b"\n")
+
+        try:
+            header = next(csv.reader([header_line.decode("utf-8-sig")]), [])
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="CSV file must be UTF-8 encoded",
+            )
+        columns = [column.strip().lower() for column in header]
+        if not any(columns):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="CSV file is empty"
+            )
+        unknown = [column for column in columns if column not in PART_IMPORT_COLUMNS]
+        missing = [
+            column
+            for column in ("name", "sku", "weight_ounces")
+            if column not in columns
+        ]
+        repeated = [column for column, count in Counter(columns).items() if count > 1]
+        if unknown or missing or repeated:
+            problems = [
+                f"{label}: {', '.join(names)}"
+                for label, names in (
+                    ("Unknown columns", unknown),
+                    ("Missing columns", missing),
+                    ("Repeated columns", repeated),
+                )
+                if names
+            ]
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="; ".join(problems)
+            )
+
+        async def body() -> AsyncIterator[bytes]:
+            if rest:
+                yield rest
+            while chunk := await upload.read(chunk_size):
+                yield chunk
+
+        return columns, body()
+
+    async def import_parts_csv(
+        self, session: AsyncSession, upload: UploadFile, owner: User
+    ) -> PartImportResponse:
+        """
+        Import a CSV catalog owned by `owner`. Rows are COPYed into a staging
+        table, validated in SQL and merged into part by SKU. Rows that fail
+        validation are reported and never abort the import.
+        """
+        logger.info(f"Importing parts from CSV for user_id={owner.id}")
+        columns, chunks = await self._read_import_header(upload)
+        try:
+            total = await self.part_repository.stage_import(session, chunks, columns)
+        except DataError as exc:
+            await session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid CSV: {exc}"
+            )
+
+        await self.part_repository.validate_import(session, str(owner.id))
+        rejected, rejected_rows = await self.part_repository.get_import_rejections(
+            session, settings.PART_IMPORT_MAX_REPORTED_REJECTIONS
+        )
+        inserted, updated = await self.part_repository.merge_import(
+            session, str(owner.id)
+        )
+        if updated:
+            # The merge doesn't report which parts it updated
+            await cache_backend.delete_prefix(PART_CACHE_PREFIX)
+        logger.info(
+            f"Imported parts for user_id={owner.id}: total={total} "
+            f"inserted={inserted} updated={updated} rejected={rejected}"
+        )
+
+        return PartImportResponse(
+            total=total,
+            inserted=inserted,
+            updated=updated,
+            # Valid rows whose SKU was taken by another user during the merge
+            skipped=total - rejected - inserted - updated,
+            rejected=rejected,
+            rejected_rows=[
+                PartImportRejectedRow(row=row, sku=sku, reason=reason)
+                for row, sku, reason in rejected_rows
+            ],
+        )
+
+    async def _resolve_bulk_conditions(
+        self,
+        session: AsyncSession,
+        selection: PartBulkSelection,
+        user: User,
+        access_condition,
+    ) -> list:
+        """
+        Turn a bulk selection into WHERE conditions after checking access in one
+        query. Explicit ids must all exist (404) and be accessible (403), while a
+        filter only ever selects parts the user is allowed to change.
+        """
+        is_admin = user.role == UserRole.ADMIN
+        if selection.ids is None:
+            conditions = self.part_repository.filter_conditions(selection.filter)
+            if not is_admin:
+                conditions.append(access_condition)
+            return conditions
+
+        part_ids = list(dict.fromkeys(selection.ids))
+        await self._check_bulk_access(session, part_ids, user, access_condition)
+
+        # Checked again by the write itself, access may be revoked in between
+        conditions = [Part.id.in_(part_ids)]
+        if not is_admin:
+            conditions.append(access_condition)
+        return conditions
+
+    async def _check_bulk_access(
+        self, session: AsyncSession, part_ids: List[Any], user: User, access_condition
+    ) -> None:
+        """
+        Check in one query that every part exists (404) and that the user is
+        an admin or access_condition holds for it (403).
+        """
+        is_admin = user.role == UserRole.ADMIN
+        access_map = await self.part_repository.get_access_map(
+            session, part_ids, None if is_admin else access_condition
+        )
+        missing = [str(part_id) for part_id in part_ids if part_id not in access_map]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Parts not found: {', '.join(missing)}",
+            )
+        denied = [
+            str(part_id) for part_id, allowed in access_map.items() if not allowed
+        ]
+        if denied:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Not authorized for parts: {', '.join(denied)}",
+            )
+
+    async def update_parts_bulk(
+        self, session: AsyncSession, bulk_update: PartBulkUpdate, user: User
+    ) -> PartBulkResult:
+        logger.info(f"Bulk updating parts by user_id={user.id}")
+        changes = bulk_update.changes.model_dump(exclude_unset=True)
+        if not changes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="No changes provided"
+            )
+
+        # Collaborators with EDIT may only touch their fields, the rest is for owners
+        allowed_fields = set(PartUpdateForCollaborators.model_fields)
+        if set(changes) <= allowed_fields:
+            access_condition = self.part_repository.edit_access_filter(str(user.id))
+        else:
+            access_condition = self.part_repository.owner_access_filter(str(user.id))
+
+        conditions = await self._resolve_bulk_conditions(
+            session, bulk_update, user, access_condition
+        )
+        updated_ids = await self.part_repository.bulk_update(
+            session, conditions, changes
+        )
+        await self._invalidate_parts(updated_ids)
+        logger.info(f"Bulk updated {len(updated_ids)} parts by user_id={user.id}")
+
+        return PartBulkResult(affected=len(updated_ids), ids=updated_ids)
+
+    async def delete_parts_bulk(
+        self, session: AsyncSession, bulk_delete: PartBulkDelete, user: User
+    ) -> PartBulkResult:
+        logger.info(f"Bulk deleting parts by user_id={user.id}")
+        conditions = await self._resolve_bulk_conditions(
+            session,
+            bulk_delete,
+            user,
+            self.part_repository.owner_access_filter(str(user.id)),
+        )
+        deleted_ids, collaborator_ids = await self.part_repository.bulk_delete(
+            session, conditions
+        )
+        await self._invalidate_parts(deleted_ids)
+        await self._invalidate_collaborator_permissions(collaborator_ids)
+        logger.info(f"Bulk deleted {len(deleted_ids)} parts by user_id={user.id}")
+
+        return PartBulkResult(affected=len(deleted_ids), ids=deleted_ids)
+
     async def get_part(
         self, session: AsyncSession, part_id: str, user: Optional[User]
     ) -> PartResponse:
         logger.info(
             f"Fetching part with id={part_id} for user_id={getattr(user, 'id', None)}"
         )
-        part = await self._get_part_or_404(session, part_id)
-        await self._check_part_access(session, part, user)
+        cached = await cache_backend.get(_part_cache_key(part_id))
+        if cached is None:
+            # A miss reads the part and the user's collaborator row together
+            part, permission = await self._get_part_with_permission_or_404(
+                session, part_id, user
+            )
+            await cache_backend.set(
+                _part_cache_key(part.id),
+                part.model_dump(mode="json"),
+                settings.PART_CACHE_TTL_SECONDS,
+            )
+        else:
+            # Collaborators are resolved from their cached permissions, so a
+            # hot private part read doesn't touch part_collaborator
+            part = PartResponse.model_validate(cached)
+            permission = self._effective_permission(part, user, None)
+            if (
+                part.visibility != PartVisibility.PUBLIC
+                and permission == EffectivePermission.none
+                and user is not None
+            ):
+                permissions = await self._get_collaborator_permissions(session, user)
+                permission = self._effective_permission(
+                    part, user, permissions.get(str(part.id))
+                )
+        self._check_part_read_permission(part, permission)
 
-        return PartResponse.model_validate(part)
+        return part
+
+    async def get_part_etag(
+        self, session: AsyncSession, part_id: str, user: Optional[User]
+    ) -> str:
+        """Current ETag of a part the user can see, without loading the part."""
+        cached = await cache_backend.get(_part_cache_key(part_id))
+        if cached is not None:
+            version = PartResponse.model_validate(cached)
+        else:
+            version = await self.part_repository.get_version(session, part_id)
+        if not version:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Part not found"
+            )
+        await self._check_part_access(session, version, user)
+
+        return part_etag(version.id, version.updated_at)
 
     async def update_part(
         self, session: AsyncSession, part_id: str, part_data: PartUpdate, user: User
     ) -> PartResponse:
         logger.info(f"Updating part id={part_id} by user_id={user.id}")
-        part = await self._get_part_or_404(session, part_id)
-        await self._check_part_edit_access(session, part, user)
-
-        is_owner_or_admin = user.role == UserRole.ADMIN or str(part.owner_id) == str(
-            user.id
+        _, permission = await self._get_part_with_permission_or_404(
+            session, part_id, user
         )
-        if is_owner_or_admin:
+        self._check_part_edit_permission(permission)
+
+        if permission != EffectivePermission.edit:
             update_fields = part_data.model_dump(exclude_unset=True)
         else:
             update_data = part_data.model_dump(exclude_unset=True)
@@ -135,6 +628,7 @@ class PartService:
             update_fields = collaborator_update.model_dump(exclude_unset=True)
 
         updated = await self.part_repository.update(session, part_id, update_fields)
+        await self._invalidate_parts([part_id])
         logger.info(f"Part updated id={part_id}")
         return PartResponse.model_validate(updated)
 
@@ -145,39 +639,80 @@ class PartService:
         part = await self._get_part_or_404(session, part_id)
         await self._check_part_owner_access(part, user)
 
+        collaborator_ids = await self.part_repository.remove_collaborators_of(
+            session, [part_id]
+        )
         await self.part_repository.delete(session, part_id)
+        await self._invalidate_parts([part_id])
+        await self._invalidate_collaborator_permissions(collaborator_ids)
         logger.info(f"Part deleted id={part_id}")
 
     async def list_parts(
         self, session: AsyncSession, user: Optional[User], params: PartListQueryParams
     ) -> PartPaginatedResponse:
-        if user and user.role == UserRole.ADMIN:
-            items, total = await self.part_repository.list_filtered(session, params)
-            return PartPaginatedResponse(
-                items=[PartResponse.model_validate(p) for p in items], total=total
-            )
+        # Owned, shared and public parts come from one statement for members so
+        # ordering, limit and total stay correct across the three sources
+        items, total, next_cursor = await self.part_repository.list_filtered(
+            session, params, **self._visibility_scope(user)
+        )
+        return PartPaginatedResponse(
+            items=[PartResponse.model_validate(p) for p in items],
+            total=total,
+            next_cursor=next_cursor,
+        )
 
-        if user:
-            owned, owned_total = await self.part_repository.list_filtered(
-                session, params, owner_id=str(user.id)
-            )
-            collab, collab_total = await self.part_repository.list_filtered(
-                session, params, collaborator_id=str(user.id)
-            )
-            public, public_total = await self.part_repository.list_filtered(
-                session, params, public_only=True
-            )
-            parts = {p.id: p for p in (owned + collab + public)}
-            return PartPaginatedResponse(
-                items=[PartResponse.model_validate(p) for p in parts.values()],
-                total=len(parts),
+    async def export_parts(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        user: Optional[User],
+        params: PartListQueryParams,
+        export_format: PartExportFormat,
+    ) -> AsyncIterator[str]:
+        """Yield every visible part serialized as NDJSON lines or CSV rows."""
+        logger.info(
+            f"Exporting parts as {export_format.value} for user_id={getattr(user, 'id', None)}"
+        )
+        fields = list(PartResponse.model_fields)
+        if export_format == PartExportFormat.csv:
+            yield ",".join(fields) + "\r\n"
+
+        # The request session is closed before the body streams, so use our own
+        async with session_factory() as session:
+            chunks = self.part_repository.stream_filtered(
+                session,
+                params,
+                settings.PART_EXPORT_CHUNK_SIZE,
+                **self._visibility_scope(user),
             )
+            async for chunk in chunks:
+                parts = [PartResponse.model_validate(p) for p in chunk]
+                if export_format == PartExportFormat.ndjson:
+                    yield "".join(f"{part.model_dump_json()}\n" for part in parts)
+                else:
+                    buffer = io.StringIO()
+                    writer = csv.writer(buffer)
+                    for part in parts:
+                        row = part.model_dump(mode="json")
+                        writer.writerow([row[field] for field in fields])
+                    yield buffer.getvalue()
 
-        items, total = await self.part_repository.list_filtered(
-            session, params, public_only=True
+    async def search_parts(
+        self,
+        session: AsyncSession,
+        user: Optional[User],
+        search_text: str,
+        limit: int,
+        offset: int,
+    ) -> PartPaginatedResponse:
+        logger.info(
+            f"Searching parts for q={search_text!r} by user_id={getattr(user, 'id', None)}"
+        )
+        items = await self.part_repository.search(
+            session, search_text, limit, offset, **self._visibility_scope(user)
         )
+
         return PartPaginatedResponse(
-            items=[PartResponse.model_validate(p) for p in items], total=total
+            items=[PartResponse.model_validate(p) for p in items]
         )
 
     async def add_collaborator(
@@ -197,6 +732,8 @@ class PartService:
         collaborator = await self.part_repository.add_collaborator(
             session, part_id, user_id, permission
         )
+        await self._invalidate_parts([part_id])
+        await self._invalidate_collaborator_permissions([user_id])
         logger.info(f"Collaborator user_id={user_id} added to part_id={part_id}")
         return PartCollaboratorResponse.model_validate(collaborator)
 
@@ -210,21 +747,138 @@ class PartService:
         await self._check_part_owner_access(part, owner)
 
         await self.part_repository.remove_collaborator(session, part_id, user_id)
+        await self._invalidate_parts([part_id])
+        await self._invalidate_collaborator_permissions([user_id])
         logger.info(f"Collaborator user_id={user_id} deleted from part_id={part_id}")
 
+    async def _check_collaborator_pairs(
+        self, session: AsyncSession, pairs, owner: User
+    ) -> None:
+        """Owner check for every part and existence check for every user."""
+        part_ids = list(dict.fromkeys(pair.part_id for pair in pairs))
+        await self._check_bulk_access(
+            session,
+            part_ids,
+            owner,
+            self.part_repository.owner_access_filter(str(owner.id)),
+        )
+        user_ids = list(dict.fromkeys(pair.user_id for pair in pairs))
+        existing = await self.user_repository.get_existing_ids(session, user_ids)
+        missing = [str(user_id) for user_id in user_ids if user_id not in existing]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Users not found: {', '.join(missing)}",
+            )
+
+    async def add_collaborators_bulk(
+        self, session: AsyncSession, grant: PartCollaboratorBulkGrant, owner: User
+    ) -> PartCollaboratorBulkResult:
+        """Share many (part, user) pairs at once, upserting their permission."""
+        logger.info(
+            f"Bulk adding {len(grant.collaborators)} collaborators by owner_id={owner.id}"
+        )
+        await self._check_collaborator_pairs(session, grant.collaborators, owner)
+        # Last one wins for repeated pairs, sorted so concurrent grants lock
+        # rows in the same order
+        permissions = {
+            (item.part_id, item.user_id): item.permission
+            for item in grant.collaborators
+        }
+        rows = [
+            {"part_id": part_id, "user_id": user_id, "permission": permission}
+            for (part_id, user_id), permission in sorted(permissions.items())
+        ]
+        collaborators = await self.part_repository.bulk_upsert_collaborators(
+            session, rows
+        )
+        await self._invalidate_parts({row["part_id"] for row in rows})
+        await self._invalidate_collaborator_permissions(
+            {row["user_id"] for row in rows}
+        )
+        logger.info(f"Bulk added {len(collaborators)} collaborators")
+
+        return PartCollaboratorBulkResult(
+            affected=len(collaborators),
+            collaborators=[
+                PartCollaboratorResponse.model_validate(c) for c in collaborators
+            ],
+        )
+
+    async def remove_collaborators_bulk(
+        self, session: AsyncSession, revoke: PartCollaboratorBulkRevoke, owner: User
+    ) -> PartCollaboratorBulkResult:
+        """Revoke many (part, user) pairs at once, unknown pairs are ignored."""
+        logger.info(
+            f"Bulk removing {len(revoke.collaborators)} collaborators by owner_id={owner.id}"
+        )
+        part_ids = list(dict.fromkeys(pair.part_id for pair in revoke.collaborators))
+        await self._check_bulk_access(
+            session,
+            part_ids,
+            owner,
+            self.part_repository.owner_access_filter(str(owner.id)),
+        )
+        pairs = sorted({(pair.part_id, pair.user_id) for pair in revoke.collaborators})
+        removed = await self.part_repository.bulk_remove_collaborators(session, pairs)
+        await self._invalidate_parts({c.part_id for c in removed})
+        await self._invalidate_collaborator_permissions({c.user_id for c in removed})
+        logger.info(f"Bulk removed {len(removed)} collaborators")
+
+        return PartCollaboratorBulkResult(
+            affected=len(removed),
+            collaborators=[PartCollaboratorResponse.model_validate(c) for c in removed],
+        )
+
     async def get_top_words_in_descriptions(
-        self, session: AsyncSession, top_number_of_words: int = 5
+        self, session: AsyncSession, user: Optional[User], params: TopWordsQueryParams
     ) -> TopWordsResponse:
-        descriptions = await self.part_repository.get_all_descriptions(session)
-
-        words = []
-        for desc in descriptions:
-            words += re.findall(r"\b\w+\b", desc.lower())
-        counter = Counter(words)
+        """
+        Most frequent description words among the parts the user can see,
+        narrowed by params. Unscoped reports are read off the word count
+        index, scoped ones are aggregated in Postgres.
+        """
+        scope = self._visibility_scope(user)
+        filters = params.model_dump(mode="json", exclude={"n"}, exclude_none=True)
+        cache_key = (
+            "top-words:"
+            + hashlib.blake2b(
+                json.dumps([scope, params.n, filters], sort_keys=True).encode(),
+                digest_size=16,
+            ).hexdigest()
+        )
+        cached = await cache_backend.get(cache_key)
+        if cached is not None:
+            return TopWordsResponse.model_validate(cached)
 
-        # here the magic happens with heaps under the most_common method
-        most_common = counter.most_common(top_number_of_words)
+        # The index only holds counts over every part, so it can only answer
+        # an admin's unfiltered report. Any other scope or filter reads its
+        # matching descriptions, see scripts/benchmark_top_words.py.
+        if not scope and not filters:
+            most_common = await self.part_repository.word_count_repository.get_top(
+                session, params.n
+            )
+        else:
+            most_common = await self.part_repository.top_words(session, params, **scope)
 
-        return TopWordsResponse(
+        top_words = TopWordsResponse(
             top_words=[WordFrequencyResponse(word=w, count=c) for w, c in most_common]
         )
+        await cache_backend.set(
+            cache_key,
+            top_words.model_dump(mode="json"),
+            settings.TOP_WORDS_CACHE_TTL_SECONDS,
+        )
+
+        return top_words
+
+    async def rebuild_word_counts(self, session: AsyncSession) -> int:
+        words = await self.part_repository.rebuild_word_counts(
+            session,
+            chunk_size=settings.WORD_COUNT_REBUILD_CHUNK_SIZE,
+            workers=settings.WORD_COUNT_REBUILD_WORKERS,
+        )
+        await cache_backend.delete_prefix("top-words:")
+        logger.info(f"Rebuilt word counts with {words} distinct words")
+
+        return words
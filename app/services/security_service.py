@@ -1,32 +1,59 @@
+import hashlib
+import secrets
+import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import Depends, HTTPException, status
 from jose import JWTError, jwt
 from loguru import logger
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_db_session
+from app.core.cache import cache_backend
+from app.core.config import settings
 from app.core.security import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     ALGORITHM,
     SECRET_KEY,
+    PasswordHasherBusy,
     oauth2_scheme,
-    pwd_context,
+    password_hasher,
 )
 from app.models.user import User
+from app.repositories.refresh_token_repository import RefreshTokenRepository
 from app.repositories.user_repository import UserRepository
-from app.schemas.security_schema import TokenData
+from app.schemas.security_schema import Token, TokenData, TokenType
+from app.schemas.user_schema import UserResponse
 
 user_repository = UserRepository()
+refresh_token_repository = RefreshTokenRepository()
 
+USER_CACHE_PREFIX = "user:"
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+
+def _hasher_busy() -> HTTPException:
+    logger.warning("Password hashing queue is full, rejecting request.")
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many concurrent password operations, try again later",
+        headers={"Retry-After": "1"},
+    )
 
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return await password_hasher.verify(plain_password, hashed_password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
+
+
+async def get_password_hash(password: str) -> str:
+    try:
+        return await password_hasher.hash(password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -41,14 +68,94 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def _hash_refresh_token(token: str) -> str:
+    """Refresh tokens are random, so a fast hash is enough to store them."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def create_refresh_token(session: AsyncSession, user: User) -> str:
+    token = secrets.token_urlsafe(32)
+    await refresh_token_repository.create(
+        session,
+        {
+            "token_hash": _hash_refresh_token(token),
+            "user_id": user.id,
+            "expires_at": datetime.now(timezone.utc)
+            + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        },
+    )
+
+    return token
+
+
+async def issue_tokens(session: AsyncSession, user: User) -> Token:
+    """Access token plus a new refresh token, issued after a password login."""
+    return Token(
+        access_token=create_access_token(
+            data={"sub": user.username, "uid": str(user.id)}
+        ),
+        refresh_token=await create_refresh_token(session, user),
+        token_type=TokenType.BEARER,
+    )
+
+
+async def refresh_tokens(session: AsyncSession, refresh_token: str) -> Token:
+    """
+    Trade a refresh token for a new access token and a new refresh token. The
+    presented token is revoked, presenting it again revokes every refresh
+    token of the user since it may have been stolen.
+    """
+    invalid_token_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    token_hash = _hash_refresh_token(refresh_token)
+    new_token = secrets.token_urlsafe(32)
+    user_id = await refresh_token_repository.rotate(
+        session,
+        token_hash,
+        _hash_refresh_token(new_token),
+        datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+    )
+    if user_id is None:
+        stored = await refresh_token_repository.get_by_hash(session, token_hash)
+        if stored is not None and stored.revoked:
+            logger.warning(f"Refresh token reused for user_id={stored.user_id}")
+            await refresh_token_repository.revoke_all(session, stored.user_id)
+        raise invalid_token_exception
+
+    user = await get_user_by_id(session, user_id)
+    if user is None or not user.is_active:
+        await refresh_token_repository.revoke_all(session, user_id)
+        raise invalid_token_exception
+
+    logger.info(f"Tokens refreshed for user: {user.username}")
+    return Token(
+        access_token=create_access_token(
+            data={"sub": user.username, "uid": str(user.id)}
+        ),
+        refresh_token=new_token,
+        token_type=TokenType.BEARER,
+    )
+
+
+async def revoke_refresh_tokens(session: AsyncSession, user_id: Any) -> None:
+    await refresh_token_repository.revoke_all(session, user_id)
+
+
+async def purge_expired_refresh_tokens(session: AsyncSession) -> int:
+    purged = await refresh_token_repository.purge_expired(session)
+    logger.info(f"Purged {purged} expired refresh tokens")
+    return purged
+
+
 async def authenticate_user(
     session: AsyncSession, username: str, password: str
 ) -> Optional[User]:
-    user = await user_repository.get_by_username(session, username)
-    if not user:
-        user = await user_repository.get_by_email(session, email=username)
+    user = await user_repository.get_by_identifier(session, username)
 
-    if not user or not verify_password(password, user.password):
+    if not user or not await verify_password(password, user.password):
         logger.warning(f"Authentication failed for user: {username}")
         return None
 
@@ -56,6 +163,73 @@ async def authenticate_user(
     return user
 
 
+def _user_id_cache_key(user_id: Any) -> str:
+    return f"{USER_CACHE_PREFIX}id:{uuid.UUID(str(user_id))}"
+
+
+def _user_subject_cache_key(subject: str) -> str:
+    return f"{USER_CACHE_PREFIX}sub:{subject}"
+
+
+async def _get_cached_user(cache_key: str) -> Optional[User]:
+    """The cached copy is a detached User without the password hash."""
+    cached = await cache_backend.get(cache_key)
+    if cached is None:
+        return None
+
+    return User(**UserResponse.model_validate(cached).model_dump())
+
+
+async def _cache_user(cache_key: str, user: User) -> None:
+    await cache_backend.set(
+        cache_key,
+        UserResponse.model_validate(user).model_dump(mode="json"),
+        settings.USER_CACHE_TTL_SECONDS,
+    )
+
+
+async def get_user_by_id(session: AsyncSession, user_id: Any) -> Optional[User]:
+    """
+    Resolve the `uid` claim of a token to its user with a primary key lookup,
+    cached so the auth dependency doesn't query the user on every request.
+    """
+    cache_key = _user_id_cache_key(user_id)
+    user = await _get_cached_user(cache_key)
+    if user is not None:
+        return user
+
+    user = await user_repository.get(session, str(user_id))
+    if user:
+        await _cache_user(cache_key, user)
+
+    return user
+
+
+async def get_user_by_subject(session: AsyncSession, subject: str) -> Optional[User]:
+    """
+    Resolve a token subject (username or email) to its user, cached the same
+    way. Only tokens issued without a `uid` claim take this path.
+    """
+    cache_key = _user_subject_cache_key(subject)
+    user = await _get_cached_user(cache_key)
+    if user is not None:
+        return user
+
+    user = await user_repository.get_by_identifier(session, subject)
+    if user:
+        await _cache_user(cache_key, user)
+
+    return user
+
+
+async def invalidate_cached_user(user_id: Any, *subjects: str) -> None:
+    """Drop the cached user under its id and every subject a token may carry."""
+    await cache_backend.delete(
+        _user_id_cache_key(user_id),
+        *(_user_subject_cache_key(subject) for subject in subjects),
+    )
+
+
 async def get_current_user(
     session: AsyncSession = Depends(get_db_session), token: str = Depends(oauth2_scheme)
 ) -> User:
@@ -71,8 +245,8 @@ async def get_current_user(
         if username is None:
             logger.warning("JWT payload missing 'sub' field.")
             raise credentials_exception
-        token_data = TokenData(username=username)
-    except JWTError:
+        token_data = TokenData(username=username, user_id=payload.get("uid"))
+    except (JWTError, ValidationError):
         logger.warning("JWT decoding failed.")
         raise credentials_exception
 
@@ -80,10 +254,13 @@ async def get_current_user(
         logger.warning("Token data missing username.")
         raise credentials_exception
 
-    user = await user_repository.get_by_username(session, username=token_data.username)
-    if not user:
-        user = await user_repository.get_by_email(session, email=token_data.username)
-
+    if token_data.user_id is not None:
+        user = await get_user_by_id(session, token_data.user_id)
+        # A token stops working once its subject no longer names the user
+        if user and token_data.username not in (user.username, user.email):
+            user = None
+    else:
+        user = await get_user_by_subject(session, token_data.username)
     if user is None:
         logger.warning(f"User not found for token username: {token_data.username}")
         raise credentials_exception
@@ -7,7 +7,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User, UserRole
 from app.repositories.user_repository import UserRepository
 from app.schemas.user_schema import UserCreate, UserResponse, UserUpdate
-from app.services.security_service import get_password_hash
+from app.services.security_service import (
+    get_password_hash,
+    invalidate_cached_user,
+    revoke_refresh_tokens,
+)
 from app.utils.validation import raise_if_duplicate
 
 
@@ -51,9 +55,11 @@ class UserService:
                 (User.email, user_data.email),
                 (User.username, user_data.username),
             ],
+            # Logins match either identifier ignoring case, see get_by_identifier
+            ignore_case=True,
         )
         user_dict = user_data.model_dump()
-        user_dict["password"] = get_password_hash(user_dict["password"])
+        user_dict["password"] = await get_password_hash(user_dict["password"])
 
         user = await self.user_repository.create(session, user_dict)
         logger.info(f"User created with id={user.id}")
@@ -82,9 +88,14 @@ class UserService:
 
         update_data = user_data.model_dump(exclude_unset=True)
         if "password" in update_data:
-            update_data["password"] = get_password_hash(update_data["password"])
+            update_data["password"] = await get_password_hash(update_data["password"])
 
+        cached_user = (user.id, user.username, user.email)
         updated_user = await self.user_repository.update(session, user_id, update_data)
+        await invalidate_cached_user(*cached_user)
+        if "password" in update_data:
+            # Sessions started with the old password must log in again
+            await revoke_refresh_tokens(session, user_id)
         logger.info(f"User updated id={user_id}")
         return UserResponse.model_validate(updated_user)
 
@@ -94,7 +105,9 @@ class UserService:
         logger.info(f"Deleting user id={user_id} by current_user_id={current_user.id}")
         user = await self._get_user_or_404(session, user_id)
         await self._check_user_access(user, current_user)
+        cached_user = (user.id, user.username, user.email)
         await self.user_repository.delete(session, user_id)
+        await invalidate_cached_user(*cached_user)
         logger.info(f"User deleted id={user_id}")
 
     async def list_users(
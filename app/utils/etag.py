@@ -0,0 +1,59 @@
+import hashlib
+from datetime import datetime
+from typing import Any, Iterable, Optional, Tuple
+
+
+def _quoted_digest(*values: Any) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        digest.update(str(value).encode())
+        digest.update(b"\x00")
+
+    return f'"{digest.hexdigest()}"'
+
+
+def _version(updated_at: Optional[datetime]) -> str:
+    # Schemas declare updated_at optional, rows always have one
+    return updated_at.isoformat() if updated_at else ""
+
+
+def part_etag(part_id: Any, updated_at: Optional[datetime]) -> str:
+    """
+    Builds the strong ETag of a single part. updated_at changes on every write,
+    so it identifies the representation without serializing it.
+    :param part_id: The id of the part
+    :param updated_at: The last modification time of the part
+    """
+    return _quoted_digest(part_id, _version(updated_at))
+
+
+def list_etag(
+    versions: Iterable[Tuple[Any, Optional[datetime]]],
+    has_next: bool,
+    total: Optional[int],
+) -> str:
+    """
+    Builds the strong ETag of a list page from the (id, updated_at) of its items.
+    :param versions: The (id, updated_at) pairs of the page items, in order
+    :param has_next: Whether the page has a next cursor
+    :param total: The total returned with the page, if any
+    """
+    values = [f"{part_id}:{_version(updated_at)}" for part_id, updated_at in versions]
+
+    return _quoted_digest(*values, has_next, total)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluates an If-None-Match header against the current ETag, using the weak
+    comparison RFC 9110 requires for this header.
+    :param if_none_match: The raw If-None-Match header value
+    :param etag: The current ETag of the resource
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
@@ -0,0 +1,57 @@
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(sort_by: str, sort_order: str, value: Any, last_id: Any) -> str:
+    """
+    Encodes the keyset position of the last row of a page into an opaque cursor.
+    :param sort_by: The name of the column the page is sorted by
+    :param sort_order: The sort direction of the page (asc/desc)
+    :param value: The sort column value of the last row
+    :param last_id: The primary key of the last row, used as tie breaker
+    """
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = {"s": sort_by, "o": sort_order, "v": value, "id": str(last_id)}
+    raw = json.dumps(payload, separators=(",", ":"))
+
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str,
+    sort_by: str,
+    sort_order: str,
+    parse_value: Optional[Callable[[Any], Any]] = None,
+) -> tuple[Any, uuid.UUID]:
+    """
+    Decodes a cursor created by encode_cursor into its (value, id) keyset position.
+    Raises a 400 if the cursor is malformed or was issued for a different sorting.
+    :param cursor: The opaque cursor sent back by the client
+    :param sort_by: The column the current request is sorted by
+    :param sort_order: The sort direction of the current request
+    :param parse_value: Optional callable to restore the sort value type
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["s"] != sort_by or payload["o"] != sort_order:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor does not match the requested sorting",
+            )
+        value = payload["v"]
+        if parse_value is not None:
+            value = parse_value(value)
+
+        return value, uuid.UUID(payload["id"])
+    except (binascii.Error, KeyError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
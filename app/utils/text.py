@@ -0,0 +1,141 @@
+import asyncio
+import multiprocessing
+import os
+import re
+import unicodedata
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterable, Iterable, Optional, Sequence
+
+# Whitespace, punctuation and symbols only exist in the first two planes,
+# the supplementary ones hold ideographs, tags and private use characters
+_LAST_SEPARATOR = 0x1FFFF
+
+
+def _escape(code_point: int) -> str:
+    # \u and \U escapes mean the same to Python's re and to Postgres' regex
+    if code_point > 0xFFFF:
+        return f"\\U{code_point:08X}"
+    return f"\\u{code_point:04X}"
+
+
+def _is_separator(char: str) -> bool:
+    category = unicodedata.category(char)
+    return char != "_" and (category[0] in "ZPS" or category == "Cc")
+
+
+def _separators() -> list[int]:
+    # U+0000 can't be stored in Postgres text
+    return [
+        code_point
+        for code_point in range(1, _LAST_SEPARATOR + 1)
+        if _is_separator(chr(code_point))
+    ]
+
+
+def _word_regex(separators: list[int]) -> str:
+    """
+    Words are runs of anything but whitespace, punctuation, symbols and
+    control characters, with _ kept as in \\w. The separators are listed as
+    code point ranges so Postgres matches exactly the same words as Python,
+    whatever the locale of the database.
+    """
+    ranges: list[list[int]] = []
+    for code_point in separators:
+        if ranges and ranges[-1][1] == code_point - 1:
+            ranges[-1][1] = code_point
+        else:
+            ranges.append([code_point, code_point])
+    characters = "".join(
+        _escape(start) if start == end else f"{_escape(start)}-{_escape(end)}"
+        for start, end in ranges
+    )
+
+    return f"[^{characters}]+"
+
+
+_SEPARATORS = _separators()
+# Shared with the SQL of PartRepository.top_words
+WORD_REGEX = _word_regex(_SEPARATORS)
+# Python's re scans a class this size range by range, mapping the separators
+# to spaces and splitting finds the same words several times faster. Every
+# character str.split() splits on is a separator.
+_TO_SPACES = dict.fromkeys(_SEPARATORS, " ")
+_ASCII_TO_SPACES = str.maketrans(
+    {chr(code_point): " " for code_point in _SEPARATORS if code_point < 128}
+)
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    """
+    Splits a description into the words counted by top-words, the words of
+    WORD_REGEX, each lowercased after the split. Postgres' lower() depends on
+    the locale, so the SQL top-words path folds its words in Python the same
+    way.
+    :param text: The text to split, None counts as empty
+    """
+    if not text:
+        return []
+    # Lowercasing ASCII never turns a letter into a separator or back
+    if text.isascii():
+        return text.lower().translate(_ASCII_TO_SPACES).split()
+
+    return [word.lower() for word in text.translate(_TO_SPACES).split()]
+
+
+def word_counts(text: Optional[str]) -> Counter:
+    """
+    Counts the words of a description, see tokenize.
+    :param text: The text to count the words of
+    """
+    return Counter(tokenize(text))
+
+
+def count_chunk(texts: Iterable[Optional[str]]) -> Counter:
+    """
+    Counts the words of a chunk of descriptions, one description at a time.
+    Top level so it can run in a worker process.
+    :param texts: The descriptions to count the words of
+    """
+    counts: Counter[str] = Counter()
+    for text in texts:
+        counts.update(tokenize(text))
+
+    return counts
+
+
+async def count_words_parallel(
+    chunks: AsyncIterable[Sequence[Optional[str]]],
+    workers: Optional[int] = None,
+    max_pending_chunks: Optional[int] = None,
+) -> Counter:
+    """
+    Counts the words of a stream of description chunks on a process pool and
+    merges the per-chunk counters as they complete. At most
+    `max_pending_chunks` chunks are in flight, so memory stays bounded by
+    the chunk size rather than by the corpus.
+    :param chunks: Chunks of descriptions, e.g. read off a server-side cursor
+    :param workers: Worker processes, defaults to the number of CPUs
+    :param max_pending_chunks: Chunks in flight, defaults to twice the workers
+    """
+    loop = asyncio.get_running_loop()
+    workers = workers or os.cpu_count() or 1
+    limit = max_pending_chunks or 2 * workers
+    # Spawned workers don't inherit the event loop or open database sockets
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        total: Counter[str] = Counter()
+        pending: set[asyncio.Future] = set()
+        async for chunk in chunks:
+            pending.add(loop.run_in_executor(pool, count_chunk, chunk))
+            if len(pending) >= limit:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    total.update(future.result())
+        for future in asyncio.as_completed(pending):
+            total.update(await future)
+
+    return total
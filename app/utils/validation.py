@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 
 async def raise_if_duplicate(
-    repo, session: AsyncSession, field_value_pairs, model=None
+    repo, session: AsyncSession, field_value_pairs, model=None, ignore_case=False
 ):
     """
     Checks for duplicates and raises an exception with a dynamic message if found.
@@ -11,8 +11,9 @@ async def raise_if_duplicate(
     :param session: The DB session
     :param field_value_pairs: List of (field, value) tuples
     :param model: The SQLAlchemy model class (optional, inferred if not provided)
+    :param ignore_case: Compare with lower() on both sides
     """
-    duplicate = await repo.exists_by_fields(session, field_value_pairs)
+    duplicate = await repo.exists_by_fields(session, field_value_pairs, ignore_case)
 
     if duplicate:
         field, value = duplicate
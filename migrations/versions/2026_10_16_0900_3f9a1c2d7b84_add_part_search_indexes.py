@@ -0,0 +1,83 @@
+"""add part search indexes
+
+Revision ID: 3f9a1c2d7b84
+Revises: 01013e86c447
+Create Date: 2026-10-16 09:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a1c2d7b84"
+down_revision: Union[str, None] = "01013e86c447"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # A stored generated column is computed for every existing row, so this
+    # rewrites part under ACCESS EXCLUSIVE. Run it in a maintenance window on
+    # large tables, the indexes below are then built without blocking writes.
+    op.add_column(
+        "part",
+        sa.Column(
+            "search_vector",
+            TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+
+    # CONCURRENTLY can't run inside a transaction, and keeps part writable while
+    # the indexes build. If a build fails, drop the INVALID index and rerun.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_part_name_trgm"),
+            "part",
+            ["name"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f("ix_part_search_vector"),
+            "part",
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_part_search_vector"),
+            table_name="part",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            op.f("ix_part_name_trgm"),
+            table_name="part",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("part", "search_vector")
@@ -0,0 +1,102 @@
+"""add part listing indexes
+
+Revision ID: 8c2e5d9a41f7
+Revises: 3f9a1c2d7b84
+Create Date: 2026-10-16 10:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8c2e5d9a41f7"
+down_revision: Union[str, None] = "3f9a1c2d7b84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PUBLIC = "visibility = 'PUBLIC'"
+PUBLIC_ACTIVE = "visibility = 'PUBLIC' AND is_active"
+
+# name, columns, partial index predicate
+LISTING_INDEXES = [
+    ("ix_part_created_at_id", ["created_at DESC", "id DESC"], None),
+    ("ix_part_updated_at_id", ["updated_at DESC", "id DESC"], None),
+    (
+        "ix_part_owner_id_created_at",
+        ["owner_id", "created_at DESC", "id DESC"],
+        None,
+    ),
+    (
+        "ix_part_owner_id_updated_at",
+        ["owner_id", "updated_at DESC", "id DESC"],
+        None,
+    ),
+    (
+        "ix_part_visibility_is_active_created_at",
+        ["visibility", "is_active", "created_at DESC", "id DESC"],
+        None,
+    ),
+    (
+        "ix_part_visibility_is_active_updated_at",
+        ["visibility", "is_active", "updated_at DESC", "id DESC"],
+        None,
+    ),
+    ("ix_part_public_created_at", ["created_at DESC", "id DESC"], PUBLIC),
+    ("ix_part_public_updated_at", ["updated_at DESC", "id DESC"], PUBLIC),
+    ("ix_part_public_active_created_at", ["created_at DESC", "id DESC"], PUBLIC_ACTIVE),
+]
+
+# Made redundant by the composite indexes starting with the same column
+REPLACED_INDEXES = [
+    ("ix_part_owner_id", ["owner_id"]),
+    ("ix_part_visibility", ["visibility"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction, and keeps part writable while
+    # the indexes build. If a build fails, drop the INVALID index and rerun.
+    with op.get_context().autocommit_block():
+        for name, columns, where in LISTING_INDEXES:
+            op.create_index(
+                name,
+                "part",
+                [sa.text(column) for column in columns],
+                unique=False,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, _ in REPLACED_INDEXES:
+            op.drop_index(
+                name,
+                table_name="part",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in REPLACED_INDEXES:
+            op.create_index(
+                name,
+                "part",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, _, _ in reversed(LISTING_INDEXES):
+            op.drop_index(
+                name,
+                table_name="part",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
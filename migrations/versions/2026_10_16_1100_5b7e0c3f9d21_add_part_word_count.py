@@ -0,0 +1,68 @@
+"""add part word count
+
+Revision ID: 5b7e0c3f9d21
+Revises: 8c2e5d9a41f7
+Create Date: 2026-10-16 11:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7e0c3f9d21"
+down_revision: Union[str, None] = "8c2e5d9a41f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "part_word_count",
+        sa.Column("word", sa.String(length=1024), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column(
+            "id", UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("word"),
+    )
+    op.create_index(
+        "ix_part_word_count_count_word",
+        "part_word_count",
+        [sa.text("count DESC"), "word"],
+        unique=False,
+    )
+
+    # Backfill from the existing descriptions, same tokens as app.utils.text
+    op.execute(
+        """
+        INSERT INTO part_word_count (word, count)
+        SELECT match[1], count(*)
+        FROM part, regexp_matches(lower(description), '\\w+', 'g') AS match
+        GROUP BY match[1]
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_part_word_count_count_word", table_name="part_word_count")
+    op.drop_table("part_word_count")
@@ -0,0 +1,51 @@
+"""add user lower identifier indexes
+
+Revision ID: e7c93b1f2a6d
+Revises: a41d6e2b8c53
+Create Date: 2026-10-16 13:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7c93b1f2a6d"
+down_revision: Union[str, None] = "a41d6e2b8c53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+IDENTIFIER_INDEXES = [
+    ("ix_user_lower_username", "lower(username)"),
+    ("ix_user_lower_email", "lower(email)"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps logins working while the indexes build
+    with op.get_context().autocommit_block():
+        for name, expression in IDENTIFIER_INDEXES:
+            op.create_index(
+                name,
+                "user",
+                [sa.text(expression)],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _ in IDENTIFIER_INDEXES:
+            op.drop_index(
+                name,
+                table_name="user",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,61 @@
+"""add part collaborator constraints
+
+Revision ID: 3b8f1d7e9c04
+Revises: e7c93b1f2a6d
+Create Date: 2026-10-16 14:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b8f1d7e9c04"
+down_revision: Union[str, None] = "e7c93b1f2a6d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep one row per (part_id, user_id) before enforcing it, the strongest
+    # permission and then the most recent one
+    op.execute(
+        """
+        DELETE FROM part_collaborator
+        WHERE id IN (
+            SELECT id
+            FROM (
+                SELECT
+                    id,
+                    row_number() OVER (
+                        PARTITION BY part_id, user_id
+                        ORDER BY permission = 'EDIT' DESC, updated_at DESC, id
+                    ) AS position
+                FROM part_collaborator
+            ) AS ranked
+            WHERE position > 1
+        )
+        """
+    )
+    op.create_unique_constraint(
+        "uq_part_collaborator_part_id_user_id",
+        "part_collaborator",
+        ["part_id", "user_id"],
+    )
+    op.create_index(
+        op.f("ix_part_collaborator_user_id"),
+        "part_collaborator",
+        ["user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_part_collaborator_user_id"), table_name="part_collaborator")
+    op.drop_constraint(
+        "uq_part_collaborator_part_id_user_id", "part_collaborator", type_="unique"
+    )
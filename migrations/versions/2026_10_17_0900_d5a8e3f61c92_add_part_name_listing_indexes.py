@@ -0,0 +1,83 @@
+"""add part name listing indexes
+
+Revision ID: d5a8e3f61c92
+Revises: 3b8f1d7e9c04
+Create Date: 2026-10-17 09:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a8e3f61c92"
+down_revision: Union[str, None] = "3b8f1d7e9c04"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PUBLIC = "visibility = 'PUBLIC'"
+
+# name, columns, partial index predicate
+LISTING_INDEXES = [
+    ("ix_part_name_id", ["name", "id"], None),
+    ("ix_part_owner_id_name", ["owner_id", "name", "id"], None),
+    (
+        "ix_part_visibility_is_active_name",
+        ["visibility", "is_active", "name", "id"],
+        None,
+    ),
+    ("ix_part_public_name", ["name", "id"], PUBLIC),
+]
+
+# Made redundant by the composite index starting with the same column
+REPLACED_INDEXES = [
+    ("ix_part_name", ["name"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction, and keeps part writable while
+    # the indexes build. If a build fails, drop the INVALID index and rerun.
+    with op.get_context().autocommit_block():
+        for name, columns, where in LISTING_INDEXES:
+            op.create_index(
+                name,
+                "part",
+                [sa.text(column) for column in columns],
+                unique=False,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, _ in REPLACED_INDEXES:
+            op.drop_index(
+                name,
+                table_name="part",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in REPLACED_INDEXES:
+            op.create_index(
+                name,
+                "part",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, _, _ in reversed(LISTING_INDEXES):
+            op.drop_index(
+                name,
+                table_name="part",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
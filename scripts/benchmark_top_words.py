@@ -0,0 +1,171 @@
+"""
+Latency of GET /parts/top-words per scope on a seeded database. Only the
+unscoped admin report is read off the word count index, every other scope
+and filter is aggregated over the matching descriptions in Postgres:
+
+    python -m scripts.benchmark_top_words --descriptions 100000
+
+Runs against the configured database, which must be migrated. Everything it
+inserts is rolled back.
+"""
+
+import argparse
+import asyncio
+import random
+import string
+import time
+import uuid
+from collections import Counter
+from typing import Awaitable, Callable
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.part import (
+    CollaboratorPermission,
+    Part,
+    PartCollaborator,
+    PartVisibility,
+)
+from app.models.user import User
+from app.repositories.base_repository import async_session_maker
+from app.repositories.part_repository import PartRepository
+from app.schemas.part_schema import TopWordsQueryParams
+from app.utils.text import tokenize
+
+INSERT_BATCH_SIZE = 5_000
+
+
+async def seed(
+    session: AsyncSession, count: int, owners: int, seed: int
+) -> tuple[list[str], Counter]:
+    """
+    Parts spread evenly over the owners, half of them public, and the first
+    owner collaborating on one part in a hundred. Returns the owner ids and
+    the word counts of the seeded descriptions.
+    """
+    # A synthetic corpus, nothing here is security related
+    rng = random.Random(seed)  # nosec B311
+    owner_ids = [str(uuid.uuid4()) for _ in range(owners)]
+    await session.execute(
+        insert(User),
+        [
+            {
+                "id": owner_id,
+                "username": f"bench-{owner_id}",
+                "email": f"bench-{owner_id}@example.com",
+                "password": "-",
+            }
+            for owner_id in owner_ids
+        ],
+    )
+
+    vocabulary = [
+        "".join(rng.choices(string.ascii_letters, k=rng.randint(3, 10)))
+        for _ in range(20_000)
+    ]
+    counts: Counter[str] = Counter()
+    part_ids = [str(uuid.uuid4()) for _ in range(count)]
+    for start in range(0, count, INSERT_BATCH_SIZE):
+        rows = []
+        for index in range(start, min(start + INSERT_BATCH_SIZE, count)):
+            description = " ".join(rng.choices(vocabulary, k=rng.randint(10, 60)))
+            counts.update(tokenize(description))
+            rows.append(
+                {
+                    "id": part_ids[index],
+                    "name": f"Part {index}",
+                    "sku": f"BENCH-{index}",
+                    "description": description,
+                    "weight_ounces": 1,
+                    "is_active": index % 10 != 0,
+                    "visibility": (
+                        PartVisibility.PUBLIC if index % 2 else PartVisibility.PRIVATE
+                    ),
+                    "owner_id": owner_ids[index % owners],
+                }
+            )
+        await session.execute(insert(Part), rows)
+
+    await session.execute(
+        insert(PartCollaborator),
+        [
+            {
+                "part_id": part_id,
+                "user_id": owner_ids[0],
+                "permission": CollaboratorPermission.READ,
+            }
+            for part_id in part_ids[1::100]
+        ],
+    )
+
+    return owner_ids, counts
+
+
+async def best_of(repeat: int, run: Callable[[], Awaitable[list]]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        best = min(best, time.perf_counter() - started)
+
+    return best
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--descriptions", type=int, default=100_000)
+    parser.add_argument("--owners", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    repository = PartRepository()
+    async with async_session_maker() as session:
+        started = time.perf_counter()
+        owner_ids, counts = await seed(
+            session, args.descriptions, args.owners, args.seed
+        )
+        await repository.word_count_repository.replace_all(session, counts)
+        print(
+            f"seeded {args.descriptions:,} parts in {time.perf_counter() - started:.1f}s"
+        )
+
+        params = TopWordsQueryParams()
+        member = owner_ids[0]
+        cases: list[tuple[str, Callable[[], Awaitable[list]]]] = [
+            (
+                "admin, index",
+                lambda: repository.word_count_repository.get_top(session, params.n),
+            ),
+            (
+                "admin, aggregated",
+                lambda: repository.top_words(session, params),
+            ),
+            (
+                "anonymous",
+                lambda: repository.top_words(session, params, public_only=True),
+            ),
+            (
+                "member",
+                lambda: repository.top_words(session, params, accessible_by=member),
+            ),
+            (
+                "member, own parts",
+                lambda: repository.top_words(
+                    session,
+                    params.model_copy(update={"owner_id": uuid.UUID(member)}),
+                    accessible_by=member,
+                ),
+            ),
+        ]
+        try:
+            for label, run in cases:
+                seconds = await best_of(args.repeat, run)
+                print(f"{label:<20} {seconds * 1000:10.1f} ms")
+        finally:
+            await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+"""
+Throughput of the top-words recount on a synthetic corpus, for an increasing
+number of worker processes, next to the old single list approach:
+
+    python -m scripts.benchmark_word_counts --descriptions 500000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import re
+import string
+import time
+from collections import Counter
+from typing import AsyncIterator
+
+from app.utils.text import count_words_parallel
+
+
+def generate_chunks(count: int, chunk_size: int, seed: int) -> list[list[str]]:
+    """Built up front so only the counting is timed."""
+    # A synthetic corpus, nothing here is security related
+    rng = random.Random(seed)  # nosec B311
+    vocabulary = [
+        "".join(rng.choices(string.ascii_letters, k=rng.randint(3, 10)))
+        for _ in range(20_000)
+    ]
+    descriptions = [
+        " ".join(rng.choices(vocabulary, k=rng.randint(10, 60))) + "."
+        for _ in range(count)
+    ]
+
+    return [
+        descriptions[start : start + chunk_size]
+        for start in range(0, count, chunk_size)
+    ]
+
+
+async def stream_chunks(chunks: list[list[str]]) -> AsyncIterator[list[str]]:
+    for chunk in chunks:
+        yield chunk
+        # Stands in for the round trip to the cursor
+        await asyncio.sleep(0)
+
+
+def count_single_list(chunks: list[list[str]]) -> Counter:
+    """What the endpoint used to do: one list of every word, then count."""
+    descriptions = [description for chunk in chunks for description in chunk]
+    words = []
+    for desc in descriptions:
+        words += re.findall(r"\b\w+\b", desc.lower())
+
+    return Counter(words)
+
+
+def report(label: str, seconds: float, descriptions: int, baseline: float) -> None:
+    print(
+        f"{label:<16} {seconds:8.2f}s {descriptions / seconds:12,.0f} desc/s "
+        f"{baseline / seconds:6.2f}x"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--descriptions", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=5_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    chunks = generate_chunks(args.descriptions, args.chunk_size, args.seed)
+
+    started = time.perf_counter()
+    expected = count_single_list(chunks)
+    baseline = time.perf_counter() - started
+    report("single list", baseline, args.descriptions, baseline)
+
+    workers = 1
+    while True:
+        started = time.perf_counter()
+        counts = await count_words_parallel(
+            stream_chunks(chunks),
+            workers=workers,
+        )
+        if counts != expected:
+            raise SystemExit(f"{workers} worker(s) counted different words")
+        report(
+            f"{workers} worker(s)",
+            time.perf_counter() - started,
+            args.descriptions,
+            baseline,
+        )
+        if workers >= args.max_workers:
+            break
+        workers = min(workers * 2, args.max_workers)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
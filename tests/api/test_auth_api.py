@@ -0,0 +1,56 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from tests.factories.user_factory import UserFactory
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_refresh_token_rotation(client: AsyncClient, db_session: AsyncSession):
+    user = UserFactory.create(session=db_session, password="testpassword123")
+    await db_session.commit()
+    response = await client.post(
+        "/auth/token", data={"username": user.email, "password": "testpassword123"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    first_refresh = response.json()["refresh_token"]
+
+    response = await client.post("/auth/refresh", json={"refresh_token": first_refresh})
+    assert response.status_code == status.HTTP_200_OK
+    tokens = response.json()
+    assert tokens["refresh_token"] != first_refresh
+    response = await client.get(
+        "/users/me", headers={"Authorization": f"Bearer {tokens['access_token']}"}
+    )
+    assert response.json()["id"] == str(user.id)
+
+    # Replaying a rotated token revokes the whole chain
+    response = await client.post("/auth/refresh", json={"refresh_token": first_refresh})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = await client.post(
+        "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_refresh_token_unknown(client: AsyncClient):
+    response = await client.post("/auth/refresh", json={"refresh_token": "unknown"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+async def test_register_rejects_identifiers_differing_in_case(
+    client: AsyncClient, db_session: AsyncSession
+):
+    user = UserFactory.create(session=db_session)
+    await db_session.commit()
+
+    for payload in (
+        {"email": user.email.upper(), "username": "case_other"},
+        {"email": "case_other@example.com", "username": user.username.upper()},
+    ):
+        response = await client.post(
+            "/auth/register", json={**payload, "password": "testpassword123"}
+        )
+        assert response.status_code == status.HTTP_409_CONFLICT
@@ -10,3 +10,15 @@ async def test_health_check(client: AsyncClient):
     response = await client.get("/health")
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {"status": "healthy"}
+
+
+async def test_cache_stats(client: AsyncClient):
+    response = await client.get("/health/cache")
+    assert response.status_code == status.HTTP_200_OK
+    assert {"hits", "misses", "evictions", "size"} <= response.json()["cache"].keys()
+
+
+async def test_password_hasher_stats(client: AsyncClient):
+    response = await client.get("/health/password-hasher")
+    assert response.status_code == status.HTTP_200_OK
+    assert {"in_flight", "rejected", "wait_seconds_avg"} <= response.json().keys()
@@ -1,3 +1,5 @@
+import csv
+import json
 import random
 import uuid
 from typing import Any, Dict, Union
@@ -5,9 +7,13 @@ from typing import Any, Dict, Union
 import httpx
 import pytest
 from faker import Faker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from app.models.part import PartVisibility
+from tests.factories.part_factory import PartFactory
+from tests.factories.user_factory import UserFactory
 
 pytestmark = pytest.mark.asyncio
 
@@ -185,3 +191,477 @@ async def test_delete_nonexistent_part_api(client_user: httpx.AsyncClient):
     non_existent_id = uuid.uuid4()
     response = await client_user.delete(f"{API_PREFIX}/{non_existent_id}")
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_list_parts_cursor_pagination(client_user: httpx.AsyncClient):
+    name_token = f"Cursor{random.randint(10000, 99999)}"
+    for index in range(5):
+        part_data = {
+            "name": f"{name_token} {index}",
+            "sku": f"SKU-CUR-{random.randint(10000, 99999)}-{index}",
+            "description": fake.sentence(),
+            "weight_ounces": random.randint(1, 100),
+        }
+        response = await client_user.post(f"{API_PREFIX}", json=part_data)
+        assert response.status_code == status.HTTP_201_CREATED
+
+    query: Dict[str, Any] = {
+        "name": name_token,
+        "sort_by": "name",
+        "sort_order": "asc",
+        "limit": 2,
+    }
+    seen_names = []
+    cursor = None
+    for _ in range(3):
+        params = {**query, "cursor": cursor} if cursor else query
+        response = await client_user.get(f"{API_PREFIX}", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == 5
+        seen_names += [item["name"] for item in data["items"]]
+        cursor = data["next_cursor"]
+
+    assert seen_names == [f"{name_token} {index}" for index in range(5)]
+    assert cursor is None
+
+
+async def test_list_parts_invalid_cursor(client_user: httpx.AsyncClient):
+    response = await client_user.get(f"{API_PREFIX}", params={"cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.parametrize("total_mode", ["exact", "estimate", "none"])
+async def test_list_parts_total_modes(
+    client_user: httpx.AsyncClient, created_part: dict[str, Any], total_mode: str
+):
+    response = await client_user.get(f"{API_PREFIX}", params={"total": total_mode})
+    assert response.status_code == status.HTTP_200_OK
+    total = response.json()["total"]
+
+    if total_mode == "none":
+        assert total is None
+    else:
+        assert isinstance(total, int)
+
+
+async def test_list_parts_invalid_total_mode(client_user: httpx.AsyncClient):
+    response = await client_user.get(f"{API_PREFIX}", params={"total": "bogus"})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_list_parts_exact_total_sees_new_parts(client_user: httpx.AsyncClient):
+    name_token = fake.lexify("tot??????????").lower()
+    for index in range(2):
+        response = await client_user.post(
+            f"{API_PREFIX}", json=_bulk_part_payload(f"SKU-{name_token}-{index}")
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = await client_user.get(
+            f"{API_PREFIX}", params={"name": name_token, "total": "exact"}
+        )
+        assert response.json()["total"] == index + 1
+
+
+async def test_search_parts_api(client_user: httpx.AsyncClient):
+    search_word = f"flux{fake.lexify('??????').lower()}"
+    part_data = {
+        "name": f"Searchable {fake.word()}",
+        "sku": f"SKU-SEARCH-{random.randint(10000, 99999)}",
+        "description": f"Capacitor with {search_word} coating",
+        "weight_ounces": 3,
+        "visibility": PartVisibility.PRIVATE.value,
+    }
+    response = await client_user.post(f"{API_PREFIX}", json=part_data)
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = await client_user.get(f"{API_PREFIX}/search", params={"q": search_word})
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["sku"] for item in response.json()["items"]] == [part_data["sku"]]
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+async def test_export_parts_api(
+    client_user: httpx.AsyncClient, created_part: dict[str, Any], export_format: str
+):
+    response = await client_user.get(
+        f"{API_PREFIX}/export",
+        params={"format": export_format, "name": created_part["name"]},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    lines = response.text.strip().splitlines()
+    if export_format == "ndjson":
+        assert created_part["sku"] in [json.loads(line)["sku"] for line in lines]
+    else:
+        rows = list(csv.DictReader(lines))
+        assert created_part["sku"] in [row["sku"] for row in rows]
+
+
+def _bulk_part_payload(sku: str) -> dict[str, Any]:
+    return {
+        "name": f"Bulk Part {sku}",
+        "sku": sku,
+        "description": fake.sentence(),
+        "weight_ounces": random.randint(1, 100),
+    }
+
+
+async def test_create_parts_bulk_api(client_user: httpx.AsyncClient):
+    skus = [f"SKU-BULK-{random.randint(10000, 99999)}-{index}" for index in range(3)]
+    response = await client_user.post(
+        f"{API_PREFIX}/bulk", json=[_bulk_part_payload(sku) for sku in skus]
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()
+    assert data["created"] == 3
+    assert [result["sku"] for result in data["results"]] == skus
+    assert all(result["status"] == "created" for result in data["results"])
+
+
+@pytest.mark.parametrize(
+    "partial, expected_status_code",
+    [(False, status.HTTP_409_CONFLICT), (True, status.HTTP_201_CREATED)],
+)
+async def test_create_parts_bulk_conflicts(
+    client_user: httpx.AsyncClient,
+    created_part: dict[str, Any],
+    partial: bool,
+    expected_status_code: int,
+):
+    new_sku = f"SKU-BULK-{random.randint(10000, 99999)}"
+    payload = [_bulk_part_payload(created_part["sku"]), _bulk_part_payload(new_sku)]
+    response = await client_user.post(
+        f"{API_PREFIX}/bulk", json=payload, params={"partial": partial}
+    )
+
+    assert response.status_code == expected_status_code
+    listing = await client_user.get(f"{API_PREFIX}", params={"name": new_sku})
+    assert (listing.json()["total"] == 1) is partial
+    if partial:
+        statuses = [result["status"] for result in response.json()["results"]]
+        assert statuses == ["conflict", "created"]
+
+
+async def test_update_parts_bulk_api(client_user: httpx.AsyncClient):
+    skus = [
+        f"SKU-BULK-UPD-{random.randint(10000, 99999)}-{index}" for index in range(2)
+    ]
+    response = await client_user.post(
+        f"{API_PREFIX}/bulk", json=[_bulk_part_payload(sku) for sku in skus]
+    )
+    part_ids = [result["part"]["id"] for result in response.json()["results"]]
+
+    response = await client_user.patch(
+        f"{API_PREFIX}/bulk",
+        json={"ids": part_ids, "changes": {"description": "Bulk updated"}},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["affected"] == 2
+    assert sorted(data["ids"]) == sorted(part_ids)
+
+    for part_id in part_ids:
+        part = (await client_user.get(f"{API_PREFIX}/{part_id}")).json()
+        assert part["description"] == "Bulk updated"
+
+    # Filter based selection, scoped to parts the user owns
+    response = await client_user.patch(
+        f"{API_PREFIX}/bulk",
+        json={"filter": {"name": [skus[0]]}, "changes": {"is_active": False}},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["ids"] == [part_ids[0]]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"changes": {"description": "No selection"}},
+        {"ids": [], "filter": {"name": ["x"]}, "changes": {"description": "Both"}},
+        {"filter": {}, "changes": {"description": "Empty filter"}},
+        {"ids": [str(uuid.uuid4())], "changes": {"sku": "SKU-NOT-ALLOWED"}},
+        {"ids": [str(uuid.uuid4())], "changes": {"name": None}},
+        {"ids": [str(uuid.uuid4())], "changes": {"description": None}},
+        {"ids": [str(uuid.uuid4())], "changes": {"weight_ounces": None}},
+    ],
+)
+async def test_update_parts_bulk_invalid_payload(
+    client_user: httpx.AsyncClient, payload: dict[str, Any]
+):
+    response = await client_user.patch(f"{API_PREFIX}/bulk", json=payload)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_update_parts_bulk_unknown_id(
+    client_user: httpx.AsyncClient, created_part: dict[str, Any]
+):
+    response = await client_user.patch(
+        f"{API_PREFIX}/bulk",
+        json={
+            "ids": [created_part["id"], str(uuid.uuid4())],
+            "changes": {"description": "Never applied"},
+        },
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    part = (await client_user.get(f"{API_PREFIX}/{created_part['id']}")).json()
+    assert part["description"] == created_part["description"]
+
+
+async def test_delete_parts_bulk_api(client_user: httpx.AsyncClient):
+    skus = [
+        f"SKU-BULK-DEL-{random.randint(10000, 99999)}-{index}" for index in range(2)
+    ]
+    response = await client_user.post(
+        f"{API_PREFIX}/bulk", json=[_bulk_part_payload(sku) for sku in skus]
+    )
+    part_ids = [result["part"]["id"] for result in response.json()["results"]]
+
+    response = await client_user.request(
+        "DELETE", f"{API_PREFIX}/bulk", json={"ids": part_ids}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["affected"] == 2
+
+    for part_id in part_ids:
+        response = await client_user.get(f"{API_PREFIX}/{part_id}")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_import_parts_csv_api(
+    client_user: httpx.AsyncClient, created_part: dict[str, Any]
+):
+    prefix = f"SKU-IMP-{random.randint(10000, 99999)}"
+    rows = [
+        "sku,name,weight_ounces,description,visibility",
+        f"{prefix}-1,Imported One,4,First,private",
+        f'{prefix}-2,"Imported, Two",5,,',
+        f"{created_part['sku']},Renamed Part,11,Updated by import,",
+        f"{prefix}-1,Repeated,4,Duplicate sku,",
+        f"{prefix}-3,Bad Weight,heavy,,",
+        f"{'X' * 31},Long Sku,1,,",
+        f"{prefix}-4,Bad Visibility,1,,SOMEWHERE",
+    ]
+    response = await client_user.post(
+        f"{API_PREFIX}/import",
+        files={"file": ("parts.csv", "\n".join(rows) + "\n", "text/csv")},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["total"] == 7
+    assert (data["inserted"], data["updated"], data["rejected"]) == (2, 1, 4)
+    assert [row["row"] for row in data["rejected_rows"]] == [4, 5, 6, 7]
+    assert data["rejected_rows"][0]["reason"] == "sku is repeated in the file"
+
+    part = (await client_user.get(f"{API_PREFIX}/{created_part['id']}")).json()
+    assert part["name"] == "Renamed Part"
+    assert part["weight_ounces"] == 11
+
+    listing = await client_user.get(f"{API_PREFIX}", params={"name": "Imported"})
+    imported = {item["sku"]: item for item in listing.json()["items"]}
+    assert imported[f"{prefix}-1"]["visibility"] == PartVisibility.PRIVATE.value
+    assert imported[f"{prefix}-2"]["name"] == "Imported, Two"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "name,sku\nA,B\n",
+        "name,sku,weight_ounces,color\nA,B,1,red\n",
+        "name,sku,weight_ounces\nA,B,1,extra\n",
+    ],
+)
+async def test_import_parts_csv_invalid_file(
+    client_user: httpx.AsyncClient, content: str
+):
+    response = await client_user.post(
+        f"{API_PREFIX}/import",
+        files={"file": ("parts.csv", content, "text/csv")},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def test_get_part_conditional_api(
+    client_user: httpx.AsyncClient, created_part: dict[str, Any]
+):
+    url = f"{API_PREFIX}/{created_part['id']}"
+    response = await client_user.get(url)
+    etag = response.headers["ETag"]
+
+    response = await client_user.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    await client_user.patch(url, json={"description": "Changed"})
+    response = await client_user.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["description"] == "Changed"
+    assert response.headers["ETag"] != etag
+
+
+async def test_list_parts_conditional_api(
+    client_user: httpx.AsyncClient,
+    created_part: dict[str, Any],
+    db_session: AsyncSession,
+):
+    params = {"name": created_part["name"]}
+    response = await client_user.get(f"{API_PREFIX}", params=params)
+    etag = response.headers["ETag"]
+
+    response = await client_user.get(
+        f"{API_PREFIX}", params=params, headers={"If-None-Match": f'W/{etag}, "x"'}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    await client_user.patch(
+        f"{API_PREFIX}/{created_part['id']}", json={"weight_ounces": 99}
+    )
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        response = await client_user.get(
+            f"{API_PREFIX}", params=params, headers={"If-None-Match": etag}
+        )
+        revalidation_statements = len(statements)
+        statements.clear()
+        await client_user.get(f"{API_PREFIX}", params=params)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    # A stale revalidation reads the page once, like a plain GET
+    assert revalidation_statements == len(statements)
+
+
+async def test_get_top_words_scoped_api(
+    client_user: httpx.AsyncClient, db_session: AsyncSession
+):
+    token = fake.lexify("tw??????????").lower()
+    word_a, word_b, word_c = (fake.lexify("tw??????????").lower() for _ in range(3))
+    owner_id = None
+    for visibility, description in (
+        (PartVisibility.PRIVATE, f"{word_a} {word_a}, {word_b}"),
+        (PartVisibility.PUBLIC, f"{word_a} {word_c}"),
+    ):
+        response = await client_user.post(
+            API_PREFIX,
+            json={
+                "name": f"{token} {visibility.value}",
+                "sku": f"SKU-TW-{fake.lexify('????????').upper()}",
+                "description": description,
+                "weight_ounces": 1,
+                "visibility": visibility.value,
+            },
+        )
+        owner_id = response.json()["owner_id"]
+    other_user = UserFactory.create(session=db_session)
+    await db_session.commit()
+    PartFactory.create(
+        session=db_session,
+        owner=other_user,
+        name=f"{token} hidden",
+        description=f"{word_a} hidden",
+        visibility=PartVisibility.PRIVATE,
+    )
+    await db_session.commit()
+
+    url = f"{API_PREFIX}/top-words"
+    response = await client_user.get(url, params={"name": token, "n": 10})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["top_words"] == [
+        {"word": word_a, "count": 3},
+        *({"word": word, "count": 1} for word in sorted((word_b, word_c))),
+    ]
+
+    response = await client_user.get(
+        url, params={"name": token, "owner_id": owner_id, "visibility": "public"}
+    )
+    assert response.json()["top_words"] == [
+        {"word": w, "count": 1} for w in sorted((word_a, word_c))
+    ]
+
+    response = await client_user.get(
+        url, params={"name": token, "owner_id": str(other_user.id)}
+    )
+    assert response.json()["top_words"] == []
+
+    response = await client_user.get(url, params={"visibility": "unknown"})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_bulk_collaborators_api(
+    client_user: httpx.AsyncClient,
+    created_part: dict[str, Any],
+    db_session: AsyncSession,
+):
+    users = [UserFactory.create(session=db_session) for _ in range(2)]
+    await db_session.commit()
+    other_part = PartFactory.create(session=db_session, owner=users[0])
+    await db_session.commit()
+    url = f"{API_PREFIX}/collaborators/bulk"
+    part_id = created_part["id"]
+
+    response = await client_user.post(
+        url,
+        json={
+            "collaborators": [
+                {"part_id": part_id, "user_id": str(user.id), "permission": "READ"}
+                for user in users
+            ]
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["affected"] == 2
+
+    response = await client_user.post(
+        url,
+        json={
+            "collaborators": [
+                {"part_id": part_id, "user_id": str(users[0].id), "permission": "EDIT"}
+            ]
+        },
+    )
+    collaborators = response.json()["collaborators"]
+    assert [(c["user_id"], c["permission"]) for c in collaborators] == [
+        (str(users[0].id), "EDIT")
+    ]
+
+    response = await client_user.post(
+        url,
+        json={
+            "collaborators": [
+                {"part_id": str(other_part.id), "user_id": str(users[1].id)}
+            ]
+        },
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = await client_user.post(
+        url,
+        json={"collaborators": [{"part_id": part_id, "user_id": str(uuid.uuid4())}]},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await client_user.request(
+        "DELETE",
+        url,
+        json={
+            "collaborators": [
+                {"part_id": part_id, "user_id": str(user.id)} for user in users
+            ]
+            + [{"part_id": part_id, "user_id": str(uuid.uuid4())}]
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["affected"] == 2
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 import httpx
@@ -8,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.pool import NullPool
 
 from app.api.dependencies import get_db_session as app_get_db_session
+from app.api.dependencies import get_db_session_factory as app_get_db_session_factory
 from app.core.config import settings
 from app.main import app as main_app
 from app.models import Base
@@ -18,6 +20,7 @@ from tests.fixtures.authorization import client_user  # noqa: F401
 from tests.fixtures.authorization import collaborator_token_headers  # noqa: F401
 from tests.fixtures.authorization import superuser_token_headers  # noqa: F401
 from tests.fixtures.authorization import user_token_headers  # noqa: F401
+from tests.fixtures.redis_server import fake_redis  # noqa: F401
 
 TEST_DATABASE_URL = settings.database_url.replace("_db", "_test_db")
 DEFAULT_POSTGRES_URL = settings.database_url.replace(settings.POSTGRES_DB, "postgres")
@@ -60,6 +63,9 @@ def manage_test_db_schema():
     create_test_db_if_not_exists()
     print(f"Creating tables in '{TEST_DB_NAME}' based on Base.metadata...")
     try:
+        with sync_test_engine.begin() as conn:
+            # Required by the trigram index on part.name
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         Base.metadata.create_all(bind=sync_test_engine)
         print("Tables created.")
         yield
@@ -99,7 +105,14 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[httpx.AsyncClient,
     async def override_get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield db_session
 
+    @asynccontextmanager
+    async def override_session_factory() -> AsyncGenerator[AsyncSession, None]:
+        yield db_session
+
     main_app.dependency_overrides[app_get_db_session] = override_get_db_session
+    main_app.dependency_overrides[app_get_db_session_factory] = lambda: (
+        override_session_factory
+    )
 
     transport = httpx.ASGITransport(app=main_app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
@@ -0,0 +1,49 @@
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_ttl_cache_counters_and_eviction():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    # "b" is now least recently used and is evicted
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+
+
+def test_ttl_cache_expiry(monkeypatch):
+    cache = TTLCache(max_size=2, ttl=10)
+    cache.set("a", 1)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_entry_ttl_overrides_default(monkeypatch):
+    cache = TTLCache(max_size=2, ttl=10)
+    cache.set("short", 1)
+    cache.set("long", 2, ttl=300)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+
+def test_ttl_cache_disabled():
+    cache = TTLCache(max_size=0, ttl=10)
+    cache.set("a", 1)
+
+    assert not cache.enabled
+    assert cache.get("a") is None
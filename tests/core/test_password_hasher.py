@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+
+from app.core.security import CryptContext, PasswordHasher, PasswordHasherBusy
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_password_hasher_bounds_queue():
+    hasher = PasswordHasher(
+        CryptContext(schemes=["bcrypt"], bcrypt__rounds=4), workers=1, max_queue=1
+    )
+    try:
+        results = await asyncio.gather(
+            *(hasher.hash(f"secret-{i}") for i in range(3)), return_exceptions=True
+        )
+        assert isinstance(results[2], PasswordHasherBusy)
+        assert await hasher.verify("secret-0", results[0])
+        assert not await hasher.verify("secret-0", results[1])
+
+        stats = hasher.stats()
+        assert stats["in_flight"] == 0
+        assert stats["completed"] == 4
+        assert stats["rejected"] == 1
+        # The second hash queued behind the first one
+        assert stats["wait_seconds_max"] > 0
+    finally:
+        hasher.close()
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+from redis.asyncio.connection import SSLConnection
+
+from app.core.cache import RedisCacheBackend, TTLCache
+from app.core.redis import create_redis_client
+from tests.fixtures.redis_server import FakeRedisServer
+
+pytestmark = pytest.mark.asyncio
+
+
+def _backend(url: str) -> RedisCacheBackend:
+    return RedisCacheBackend(
+        client=create_redis_client(url, timeout=0.5),
+        local=TTLCache(max_size=100, ttl=60),
+        channel="test:invalidation",
+        key_prefix="test:",
+    )
+
+
+async def test_redis_backend_shared_across_workers(fake_redis: FakeRedisServer):
+    worker_a, worker_b = _backend(fake_redis.url), _backend(fake_redis.url)
+    for worker in (worker_a, worker_b):
+        await worker.start()
+        await asyncio.wait_for(worker.subscribed.wait(), 1)
+
+    try:
+        await worker_a.set("part:1", {"name": "Bolt"}, ttl=60)
+        assert fake_redis.data[b"test:part:1"][0] == b'{"name": "Bolt"}'
+        # Worker B misses locally, reads it from Redis and keeps a local copy
+        assert await worker_b.get("part:1") == {"name": "Bolt"}
+        assert worker_b.local.get("part:1") == {"name": "Bolt"}
+
+        await worker_a.delete("part:1")
+        for _ in range(50):
+            if worker_b.local.get("part:1") is None:
+                break
+            await asyncio.sleep(0.01)
+        assert await worker_b.get("part:1") is None
+
+        await worker_a.set("part:2", {"name": "Nut"}, ttl=60)
+        assert await worker_b.get("part:2") == {"name": "Nut"}
+        await worker_a.delete_prefix("part:")
+        assert fake_redis.data == {}
+    finally:
+        await worker_a.close()
+        await worker_b.close()
+
+
+async def test_redis_backend_degrades_to_misses(fake_redis: FakeRedisServer):
+    url = fake_redis.url
+    await fake_redis.stop()
+    backend = _backend(url)
+
+    await backend.set("part:1", {"name": "Bolt"}, ttl=60)
+    backend.local.clear()
+
+    assert await backend.get("part:1") is None
+    assert backend.stats()["errors"] == 2
+
+
+async def test_redis_client_supports_tls_urls():
+    client = create_redis_client("rediss://cache.internal:6380/1", pool_size=3)
+    pool = client.connection_pool
+
+    assert pool.connection_class is SSLConnection
+    assert pool.connection_kwargs["db"] == 1
+    assert pool.max_connections == 3
+    await client.aclose()
@@ -2,8 +2,8 @@ import factory
 from factory.alchemy import SQLAlchemyModelFactory
 from faker import Faker
 
+from app.core.security import pwd_context
 from app.models.user import User, UserRole
-from app.services.security_service import get_password_hash
 
 fake = Faker()
 
@@ -13,8 +13,9 @@ class UserFactory(SQLAlchemyModelFactory):
         model = User
         sqlalchemy_session_persistence = "flush"
 
-    email = factory.LazyFunction(fake.email)
-    username = factory.LazyFunction(lambda: fake.user_name()[:50])
+    # Unique so a test run creating many users never collides
+    email = factory.LazyFunction(lambda: fake.unique.email())
+    username = factory.LazyFunction(lambda: fake.unique.user_name()[:50])
     is_active = True
     role = UserRole.MEMBER
     is_superuser = False
@@ -29,7 +30,7 @@ class UserFactory(SQLAlchemyModelFactory):
         cls._meta.sqlalchemy_session = session
 
         raw_password = kwargs.pop("password", "testpassword123")
-        kwargs["password"] = get_password_hash(raw_password)
+        kwargs["password"] = pwd_context.hash(raw_password)
 
         if kwargs.pop("is_superuser", False):
             kwargs["role"] = UserRole.ADMIN
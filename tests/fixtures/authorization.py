@@ -2,15 +2,12 @@ from typing import AsyncGenerator
 
 import httpx
 import pytest
-from faker import Faker
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.security_service import create_access_token
 from tests.constants.user import UserTestConstants
 from tests.factories.user_factory import UserFactory
 
-fake = Faker()
-
 
 @pytest.fixture(scope="function")
 async def superuser_token_headers(db_session: AsyncSession) -> dict[str, str]:
@@ -23,7 +20,7 @@ async def superuser_token_headers(db_session: AsyncSession) -> dict[str, str]:
     )
     await db_session.commit()
 
-    token_data = {"sub": user.email}
+    token_data = {"sub": user.email, "uid": str(user.id)}
     access_token = create_access_token(data=token_data)
     headers = {"Authorization": f"Bearer {access_token}"}
 
@@ -35,19 +32,14 @@ async def _generate_token_headers(
     password: str,
     is_superuser: bool = False,
 ) -> dict[str, str]:
-    test_email = fake.email()
-    test_username = fake.user_name()[:50]
-
     user = UserFactory.create(
         session=db_session,
-        email=test_email,
-        username=test_username,
         password=password,
         is_superuser=is_superuser,
     )
     await db_session.commit()
 
-    token_data = {"sub": user.email}
+    token_data = {"sub": user.email, "uid": str(user.id)}
     access_token = create_access_token(data=token_data)
 
     return {"Authorization": f"Bearer {access_token}"}
@@ -0,0 +1,107 @@
+import asyncio
+import fnmatch
+import time
+from typing import AsyncGenerator, Optional
+
+import pytest
+
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+def _array(items: list[bytes]) -> bytes:
+    return b"*%d\r\n" % len(items) + b"".join(items)
+
+
+class FakeRedisServer:
+    """
+    Stand-in speaking enough RESP2 for the cache backend: strings with expiry,
+    DEL/UNLINK, SCAN and pub/sub. Lets the Redis backend run without Redis.
+    """
+
+    def __init__(self) -> None:
+        self.data: dict[bytes, tuple[bytes, Optional[float]]] = {}
+        self.subscribers: dict[bytes, set[asyncio.StreamWriter]] = {}
+        self.server: Optional[asyncio.Server] = None
+
+    @property
+    def url(self) -> str:
+        assert self.server is not None
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"redis://{host}:{port}/0"
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        assert self.server is not None
+        self.server.close()
+        for writers in self.subscribers.values():
+            for writer in writers:
+                writer.close()
+        await self.server.wait_closed()
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                header = await reader.readuntil(b"\r\n")
+                args = []
+                for _ in range(int(header[1:-2])):
+                    length = int((await reader.readuntil(b"\r\n"))[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                writer.write(self._handle(args, writer))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    def _handle(self, args: list[bytes], writer: asyncio.StreamWriter) -> bytes:
+        command = args[0].upper()
+        if command in (b"PING", b"AUTH", b"SELECT"):
+            return b"+OK\r\n"
+        if command == b"GET":
+            return _bulk(self._get(args[1]))
+        if command == b"SET":
+            expires_at = None
+            if len(args) == 5 and args[3].upper() == b"PX":
+                expires_at = time.monotonic() + int(args[4]) / 1000
+            self.data[args[1]] = (args[2], expires_at)
+            return b"+OK\r\n"
+        if command in (b"DEL", b"UNLINK"):
+            removed = [key for key in args[1:] if self.data.pop(key, None)]
+            return b":%d\r\n" % len(removed)
+        if command == b"SCAN":
+            pattern = args[args.index(b"MATCH") + 1].decode()
+            keys = [key for key in self.data if fnmatch.fnmatch(key.decode(), pattern)]
+            return _array([_bulk(b"0"), _array([_bulk(key) for key in keys])])
+        if command == b"PUBLISH":
+            writers = self.subscribers.get(args[1], set())
+            for subscriber in writers:
+                subscriber.write(
+                    _array([_bulk(b"message"), _bulk(args[1]), _bulk(args[2])])
+                )
+            return b":%d\r\n" % len(writers)
+        if command == b"SUBSCRIBE":
+            self.subscribers.setdefault(args[1], set()).add(writer)
+            return _array([_bulk(b"subscribe"), _bulk(args[1]), b":1\r\n"])
+
+        return b"-ERR unknown command\r\n"
+
+
+@pytest.fixture
+async def fake_redis() -> AsyncGenerator[FakeRedisServer, None]:
+    server = FakeRedisServer()
+    await server.start()
+    yield server
+    await server.stop()
@@ -0,0 +1,95 @@
+import uuid
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.base_repository import Explain
+from app.repositories.user_repository import UserRepository
+from tests.factories.user_factory import UserFactory
+
+pytestmark = pytest.mark.asyncio
+
+user_repository = UserRepository()
+
+
+async def test_get_by_identifier_ignores_case(db_session: AsyncSession):
+    user = UserFactory.create(session=db_session)
+    await db_session.commit()
+
+    for identifier in (
+        user.username,
+        user.username.upper(),
+        user.email,
+        user.email.upper(),
+    ):
+        found = await user_repository.get_by_identifier(db_session, identifier)
+        assert found is not None
+        assert found.id == user.id
+
+    assert await user_repository.get_by_identifier(db_session, "nobody") is None
+
+
+async def test_identifier_query_uses_lower_indexes(db_session: AsyncSession):
+    query = user_repository.identifier_query("Someone@Example.com")
+
+    # The test table is tiny, rule out a sequential scan to check the indexes
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = (await db_session.execute(Explain(query))).scalar_one()
+
+    plan_text = str(plan)
+    assert "ix_user_lower_username" in plan_text
+    assert "ix_user_lower_email" in plan_text
+    assert "Seq Scan" not in plan_text
+
+
+async def test_update_and_delete_return_in_one_statement(db_session: AsyncSession):
+    user = UserFactory.create(session=db_session)
+    await db_session.commit()
+    updated_at = user.updated_at
+
+    updated = await user_repository.update(
+        db_session, user.id, {"username": f"{user.username}_renamed"}
+    )
+    # The instance already in the session is refreshed from RETURNING
+    assert updated is not None
+    assert updated is user
+    assert user.username.endswith("_renamed")
+    assert user.updated_at > updated_at
+
+    assert (
+        await user_repository.update(db_session, uuid.uuid4(), {"is_active": False})
+        is None
+    )
+    assert await user_repository.delete(db_session, user.id) is True
+    assert await user_repository.delete(db_session, user.id) is False
+    assert await user_repository.get(db_session, user.id) is None
+
+
+async def test_create_is_a_single_statement(db_session: AsyncSession):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        # The test session commits to savepoints, those are not round trips
+        if not statement.startswith(("SAVEPOINT", "RELEASE")):
+            statements.append(statement)
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        user = await user_repository.create(
+            db_session,
+            {
+                "username": f"single_{uuid.uuid4().hex[:8]}",
+                "email": f"{uuid.uuid4().hex[:8]}@example.com",
+                "password": "hashed",
+            },
+        )
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+
+    assert [s.split()[0] for s in statements] == ["INSERT"]
+    # Server and Python side defaults are all loaded from RETURNING
+    assert user.id is not None
+    assert user.created_at is not None and user.updated_at is not None
+    assert user.is_active is True
@@ -1,14 +1,25 @@
 import random
+from collections import Counter
 
 import pytest
 from faker import Faker
 from fastapi import HTTPException
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.part import Part, PartVisibility
+from app.core.cache import cache_backend
+from app.models.part import CollaboratorPermission, Part, PartVisibility
 from app.models.user import User
-from app.schemas.part_schema import PartCreate, PartUpdate
+from app.schemas.part_schema import (
+    PartCreate,
+    PartListQueryParams,
+    PartSortBy,
+    PartUpdate,
+    SortOrder,
+    TopWordsQueryParams,
+)
 from app.services.part_service import PartService
+from app.utils.text import word_counts
 from tests.factories.part_factory import PartFactory
 from tests.factories.user_factory import UserFactory
 
@@ -66,6 +77,29 @@ async def test_get_part(db_session: AsyncSession, test_part: Part, test_user: Us
     assert retrieved_part.owner_id == test_user.id
 
 
+async def test_get_part_cache(
+    db_session: AsyncSession, test_part: Part, test_user: User
+):
+    part_id = str(test_part.id)
+    hits = cache_backend.stats()["hits"]
+
+    await part_service.get_part(session=db_session, part_id=part_id, user=test_user)
+    await part_service.get_part(session=db_session, part_id=part_id, user=test_user)
+    assert cache_backend.stats()["hits"] == hits + 1
+
+    # Writes drop the cached entry, the next read sees the new values
+    await part_service.update_part(
+        session=db_session,
+        part_id=part_id,
+        part_data=PartUpdate(name="Renamed Cached Part"),
+        user=test_user,
+    )
+    refetched_part = await part_service.get_part(
+        session=db_session, part_id=part_id, user=test_user
+    )
+    assert refetched_part.name == "Renamed Cached Part"
+
+
 async def test_update_part(db_session: AsyncSession, test_part: Part, test_user: User):
     update_data = PartUpdate(
         name="Updated Part Name",
@@ -110,3 +144,304 @@ async def test_delete_part(db_session: AsyncSession, test_part: Part, test_user:
         )
 
     assert exc_info.value.status_code == 404
+
+
+async def test_list_parts_member_visibility(db_session: AsyncSession, test_user: User):
+    other_user = UserFactory.create(session=db_session)
+    await db_session.commit()
+    name_token = f"Visible{random.randint(10000, 99999)}"
+    owned = PartFactory.create(
+        session=db_session,
+        owner=test_user,
+        name=f"{name_token} owned",
+        visibility=PartVisibility.PRIVATE,
+    )
+    public = PartFactory.create(
+        session=db_session,
+        owner=other_user,
+        name=f"{name_token} public",
+        visibility=PartVisibility.PUBLIC,
+    )
+    shared = PartFactory.create(
+        session=db_session,
+        owner=other_user,
+        name=f"{name_token} shared",
+        visibility=PartVisibility.PRIVATE,
+    )
+    PartFactory.create(
+        session=db_session,
+        owner=other_user,
+        name=f"{name_token} hidden",
+        visibility=PartVisibility.PRIVATE,
+    )
+    await db_session.commit()
+    await part_service.part_repository.add_collaborator(
+        db_session, str(shared.id), str(test_user.id), CollaboratorPermission.READ
+    )
+
+    params = PartListQueryParams(
+        name=[name_token], sort_by=PartSortBy.name, sort_order=SortOrder.asc
+    )
+    result = await part_service.list_parts(db_session, test_user, params)
+
+    assert result.total == 3
+    assert [item.id for item in result.items] == [owned.id, public.id, shared.id]
+
+    first_page = await part_service.list_parts(
+        db_session, test_user, params.model_copy(update={"limit": 2})
+    )
+    assert len(first_page.items) == 2
+    assert first_page.total == 3
+    assert first_page.next_cursor is not None
+
+    # Pages merge the owned, public and shared parts in order
+    next_page = await part_service.list_parts(
+        db_session,
+        test_user,
+        params.model_copy(update={"limit": 2, "cursor": first_page.next_cursor}),
+    )
+    assert [item.id for item in next_page.items] == [shared.id]
+    offset_page = await part_service.list_parts(
+        db_session, test_user, params.model_copy(update={"limit": 2, "offset": 1})
+    )
+    assert [item.id for item in offset_page.items] == [public.id, shared.id]
+
+
+async def test_word_counts_follow_part_writes(
+    db_session: AsyncSession, test_user: User
+):
+    kept, dropped, added = (fake.lexify("wc??????????").lower() for _ in range(3))
+    counts = part_service.part_repository.word_count_repository.get_counts
+
+    part = await part_service.create_part(
+        session=db_session,
+        part_data=PartCreate(
+            name="Word count part",
+            sku=f"SKU-WC-{fake.lexify('????????').upper()}",
+            description=f"{kept} {dropped} {kept.upper()}",
+            weight_ounces=1,
+        ),
+        owner=test_user,
+    )
+    assert await counts(db_session, [kept, dropped, added]) == {kept: 2, dropped: 1}
+
+    await part_service.update_part(
+        session=db_session,
+        part_id=str(part.id),
+        part_data=PartUpdate(description=f"{kept} {added}"),
+        user=test_user,
+    )
+    assert await counts(db_session, [kept, dropped, added]) == {kept: 1, added: 1}
+
+    await part_service.delete_part(
+        session=db_session, part_id=str(part.id), user=test_user
+    )
+    assert await counts(db_session, [kept, dropped, added]) == {}
+
+
+async def test_rebuild_word_counts(db_session: AsyncSession, test_user: User):
+    word = fake.lexify("wc??????????").lower()
+    # Factory parts skip the repository, so the index doesn't know the word yet
+    PartFactory.create(session=db_session, owner=test_user, description=f"{word} x")
+    PartFactory.create(session=db_session, owner=test_user, description=word)
+    await db_session.commit()
+    counts = part_service.part_repository.word_count_repository.get_counts
+    assert await counts(db_session, [word]) == {}
+
+    await part_service.rebuild_word_counts(db_session)
+
+    assert await counts(db_session, [word]) == {word: 2}
+    top = await part_service.get_top_words_in_descriptions(
+        db_session, None, TopWordsQueryParams(n=1)
+    )
+    assert len(top.top_words) == 1
+
+
+async def test_top_words_agree_between_index_and_filters(
+    db_session: AsyncSession, test_user: User
+):
+    suffix = str(random.randint(10**8, 10**9))
+    descriptions = [
+        f"Café{suffix} CAFÉ{suffix}, naïve{suffix}!",
+        f"ΣΟΦΊΑ{suffix} σοφία{suffix} Straße{suffix} don't{suffix}",
+        f"日本語{suffix}。x²y{suffix} foo_bar{suffix} e\u0301t{suffix}",
+    ]
+    for index, description in enumerate(descriptions):
+        await part_service.create_part(
+            session=db_session,
+            part_data=PartCreate(
+                name=f"Top words {suffix}",
+                sku=f"SKU-TW-{suffix}-{index}",
+                description=description,
+                weight_ounces=1,
+            ),
+            owner=test_user,
+        )
+    expected: Counter[str] = Counter()
+    for description in descriptions:
+        expected.update(word_counts(description))
+    assert expected[f"café{suffix}"] == 2
+    assert expected[f"σοφία{suffix}"] == 2
+
+    # Incrementally indexed words against a report Postgres tokenizes
+    indexed = await part_service.part_repository.word_count_repository.get_counts(
+        db_session, list(expected)
+    )
+    filtered = await part_service.get_top_words_in_descriptions(
+        db_session,
+        test_user,
+        TopWordsQueryParams(n=100, name=[f"Top words {suffix}"]),
+    )
+
+    assert indexed == expected
+    assert {item.word: item.count for item in filtered.top_words} == expected
+
+
+async def test_part_access_by_effective_permission(
+    db_session: AsyncSession, test_user: User
+):
+    reader, editor, stranger = (
+        UserFactory.create(session=db_session) for _ in range(3)
+    )
+    await db_session.commit()
+    part = PartFactory.create(
+        session=db_session, owner=test_user, visibility=PartVisibility.PRIVATE
+    )
+    await db_session.commit()
+    part_id = str(part.id)
+    for collaborator, permission in (
+        (reader, CollaboratorPermission.READ),
+        (editor, CollaboratorPermission.EDIT),
+    ):
+        await part_service.part_repository.add_collaborator(
+            db_session, part_id, str(collaborator.id), permission
+        )
+
+    assert (await part_service.get_part(db_session, part_id, reader)).id == part.id
+    for user in (stranger, None):
+        with pytest.raises(HTTPException) as exc_info:
+            await part_service.get_part(db_session, part_id, user)
+        assert exc_info.value.status_code == 403
+
+    with pytest.raises(HTTPException) as exc_info:
+        await part_service.update_part(
+            db_session, part_id, PartUpdate(name="Read only"), reader
+        )
+    assert exc_info.value.status_code == 403
+
+    updated = await part_service.update_part(
+        db_session, part_id, PartUpdate(name="Edited"), editor
+    )
+    assert updated.name == "Edited"
+    with pytest.raises(HTTPException) as exc_info:
+        await part_service.update_part(
+            db_session,
+            part_id,
+            PartUpdate(visibility=PartVisibility.PUBLIC),
+            editor,
+        )
+    assert exc_info.value.status_code == 403
+
+
+async def test_collaborator_permissions_cached(
+    db_session: AsyncSession, test_user: User
+):
+    reader = UserFactory.create(session=db_session)
+    await db_session.commit()
+    part = PartFactory.create(
+        session=db_session, owner=test_user, visibility=PartVisibility.PRIVATE
+    )
+    await db_session.commit()
+    part_id = str(part.id)
+    await part_service.add_collaborator(
+        db_session, part_id, str(reader.id), CollaboratorPermission.READ, test_user
+    )
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        # A cold read loads the part with the reader's permission in one query
+        assert (await part_service.get_part(db_session, part_id, reader)).id == part.id
+        assert len(statements) == 1
+        # The next one fills the reader's permissions, after that none are needed
+        await part_service.get_part(db_session, part_id, reader)
+        statements.clear()
+        assert (await part_service.get_part(db_session, part_id, reader)).id == part.id
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert statements == []
+
+    await part_service.remove_collaborator(
+        db_session, part_id, str(reader.id), test_user
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        await part_service.get_part(db_session, part_id, reader)
+    assert exc_info.value.status_code == 403
+
+
+async def test_collaborator_permissions_fill_racing_a_revoke(
+    db_session: AsyncSession, test_user: User, monkeypatch
+):
+    reader = UserFactory.create(session=db_session)
+    await db_session.commit()
+    part = PartFactory.create(
+        session=db_session, owner=test_user, visibility=PartVisibility.PRIVATE
+    )
+    await db_session.commit()
+    part_id = str(part.id)
+    await part_service.add_collaborator(
+        db_session, part_id, str(reader.id), CollaboratorPermission.READ, test_user
+    )
+    repository = part_service.part_repository
+    read_permissions = repository.get_collaborator_permissions
+
+    async def read_then_revoke(session, user_id):
+        # The revoke commits and invalidates after the fill read the grant,
+        # before the fill caches it
+        permissions = await read_permissions(session, user_id)
+        monkeypatch.setattr(
+            repository, "get_collaborator_permissions", read_permissions
+        )
+        await part_service.remove_collaborator(
+            db_session, part_id, str(reader.id), test_user
+        )
+        return permissions
+
+    monkeypatch.setattr(repository, "get_collaborator_permissions", read_then_revoke)
+    permissions = await part_service._get_collaborator_permissions(db_session, reader)
+    assert part_id in permissions
+
+    assert await part_service._get_collaborator_permissions(db_session, reader) == {}
+    with pytest.raises(HTTPException) as exc_info:
+        await part_service.get_part(db_session, part_id, reader)
+    assert exc_info.value.status_code == 403
+
+
+async def test_delete_shared_part(db_session: AsyncSession, test_user: User):
+    reader = UserFactory.create(session=db_session)
+    await db_session.commit()
+    part = PartFactory.create(
+        session=db_session, owner=test_user, visibility=PartVisibility.PRIVATE
+    )
+    await db_session.commit()
+    part_id = str(part.id)
+    await part_service.add_collaborator(
+        db_session, part_id, str(reader.id), CollaboratorPermission.READ, test_user
+    )
+    await part_service.get_part(db_session, part_id, reader)
+
+    await part_service.delete_part(db_session, part_id, test_user)
+
+    assert (
+        await part_service.part_repository.get_collaborator_permissions(
+            db_session, str(reader.id)
+        )
+        == {}
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        await part_service.get_part(db_session, part_id, reader)
+    assert exc_info.value.status_code == 404
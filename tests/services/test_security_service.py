@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import cache_backend
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.schemas.user_schema import UserUpdate
+from app.services.security_service import (
+    create_access_token,
+    create_refresh_token,
+    get_current_user,
+    purge_expired_refresh_tokens,
+    refresh_token_repository,
+    refresh_tokens,
+)
+from app.services.user_service import UserService
+from tests.factories.user_factory import UserFactory
+
+pytestmark = pytest.mark.asyncio
+
+user_service = UserService()
+
+
+@pytest.fixture
+async def test_user(db_session: AsyncSession) -> User:
+    user = UserFactory.create(session=db_session)
+    await db_session.commit()
+    return user
+
+
+async def test_get_current_user_cached_by_uid(
+    db_session: AsyncSession, test_user: User
+):
+    token = create_access_token({"sub": test_user.username, "uid": str(test_user.id)})
+
+    user = await get_current_user(session=db_session, token=token)
+    assert user.id == test_user.id
+    hits = cache_backend.stats()["hits"]
+    cached = await get_current_user(session=db_session, token=token)
+    assert cached.id == test_user.id
+    assert cached.role == test_user.role
+    assert cache_backend.stats()["hits"] == hits + 1
+
+    await user_service.update_user(
+        db_session, str(test_user.id), UserUpdate(is_active=False), test_user
+    )
+    user = await get_current_user(session=db_session, token=token)
+    assert user.is_active is False
+
+    # Renaming the user retires tokens issued for the old username
+    await user_service.update_user(
+        db_session, str(test_user.id), UserUpdate(username=f"{user.username}2"), user
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(session=db_session, token=token)
+    assert exc_info.value.status_code == 401
+
+
+async def test_get_current_user_without_uid(db_session: AsyncSession, test_user: User):
+    token = create_access_token({"sub": test_user.email})
+    user = await get_current_user(session=db_session, token=token)
+    assert user.id == test_user.id
+
+    await user_service.delete_user(db_session, str(test_user.id), test_user)
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(session=db_session, token=token)
+    assert exc_info.value.status_code == 401
+
+
+async def test_get_current_user_invalid_uid(db_session: AsyncSession, test_user: User):
+    token = create_access_token({"sub": test_user.username, "uid": "not-a-uuid"})
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(session=db_session, token=token)
+    assert exc_info.value.status_code == 401
+
+
+async def test_expired_refresh_tokens_are_purged(
+    db_session: AsyncSession, test_user: User
+):
+    other_user = UserFactory.create(session=db_session)
+    await db_session.commit()
+    expired_at = datetime.now(timezone.utc) - timedelta(days=1)
+    for index, user in enumerate((test_user, test_user, other_user)):
+        await refresh_token_repository.create(
+            db_session,
+            {
+                "token_hash": f"expired-{user.id}-{index}",
+                "user_id": user.id,
+                "expires_at": expired_at,
+                "revoked": index == 0,
+            },
+        )
+
+    async def token_hashes() -> set[str]:
+        result = await db_session.execute(
+            select(RefreshToken.token_hash).where(
+                RefreshToken.user_id.in_([test_user.id, other_user.id])
+            )
+        )
+        return set(result.scalars().all())
+
+    # Rotating only drops the expired tokens of the user refreshing
+    await refresh_tokens(db_session, await create_refresh_token(db_session, test_user))
+    hashes = await token_hashes()
+    assert len(hashes) == 3
+    assert f"expired-{other_user.id}-2" in hashes
+
+    assert await purge_expired_refresh_tokens(db_session) >= 1
+    hashes = await token_hashes()
+    assert len(hashes) == 2
+    assert not any(token_hash.startswith("expired-") for token_hash in hashes)
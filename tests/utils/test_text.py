@@ -0,0 +1,40 @@
+import re
+from collections import Counter
+
+import pytest
+
+from app.utils.text import WORD_REGEX, count_words_parallel, tokenize, word_counts
+
+
+async def _chunks(descriptions, chunk_size):
+    for start in range(0, len(descriptions), chunk_size):
+        yield descriptions[start : start + chunk_size]
+
+
+@pytest.mark.asyncio
+async def test_count_words_parallel_matches_serial_count():
+    descriptions = [f"Bolt {i % 7} nut, NUT and washer_{i % 3}" for i in range(50)]
+    descriptions += [None, ""]
+    expected = Counter()
+    for description in descriptions:
+        expected.update(word_counts(description))
+
+    counts = await count_words_parallel(
+        _chunks(descriptions, 8), workers=2, max_pending_chunks=2
+    )
+
+    assert counts == expected
+    assert counts["nut"] == 100
+
+
+def test_tokenize_finds_the_words_of_word_regex():
+    texts = [
+        "Bolt M6, NUT & washer_2 (zinc)",
+        "Écrou à\tœil — Straße «inox» 10%",
+        "Muñeca ИЗОЛЯТОР…絶縁体 \U0001f529 fin.",
+    ]
+
+    for text in texts:
+        words = [word.lower() for word in re.findall(WORD_REGEX, text)]
+        assert tokenize(text) == words
+    assert tokenize(texts[1]) == ["écrou", "à", "œil", "straße", "inox", "10"]